@@ -3,7 +3,17 @@
 Training script that uses external Azure data.
 """
 import os
-import json
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2)
 
 def load_training_data():
     """Load training data from external source."""
@@ -34,8 +44,8 @@ def train():
     training_data = load_training_data()
     pretrained_model = load_pretrained_model()
     
-    print(f"Training data: {json.dumps(training_data, indent=2)}")
-    print(f"Pretrained model: {json.dumps(pretrained_model, indent=2)}")
+    print(f"Training data: {_dumps(training_data)}")
+    print(f"Pretrained model: {_dumps(pretrained_model)}")
     
     if training_data["status"] == "loaded" and pretrained_model["status"] == "loaded":
         print("✅ All external data available - training can proceed")
@@ -46,4 +56,4 @@ def train():
 
 if __name__ == "__main__":
     result = train()
-    print(f"Training result: {json.dumps(result, indent=2)}")
\ No newline at end of file
+    print(f"Training result: {_dumps(result)}")
\ No newline at end of file
@@ -12,22 +12,24 @@ Implements 8 CLI verbs with Operations facade integration:
 """
 from __future__ import annotations
 
-import os
+import functools
 import typer
-from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from modelops_contracts.artifacts import BundleRef
-from .operations import Operations, OpsConfig, run_and_exit
-from .operations.printers import (
-    print_resolved_bundle, print_materialize_summary, print_export_summary,
-    print_push_summary, print_stub_message
-)
-from .runtime_types import ContentProvider
-from .cli_context import CLIContext
+# Heavy imports (contracts, operations, providers, registry clients) are
+# deferred to the command callbacks so --help and argument errors only pay
+# for Typer itself
+if TYPE_CHECKING:
+    from modelops_contracts.artifacts import BundleRef
+    from .operations import Operations, OpsConfig
+    from .runtime_types import ContentProvider
+    from .cli_context import CLIContext
 
 app = typer.Typer(name="modelops-bundles", help="ModelOps Bundles CLI")
 
+# Relative local path prefixes (./, ../, .\, ..\)
+_REL_PREFIXES = ("./", "../", ".\\", "..\\")
+
 def _parse_bundle_ref(ref_str: str) -> BundleRef:
     """
     Parse bundle reference string into BundleRef object.
@@ -49,69 +51,115 @@ def _parse_bundle_ref(ref_str: str) -> BundleRef:
     Raises:
         ValueError: If ref_str format is invalid
     """
+    from modelops_contracts.artifacts import BundleRef
+    
     ref_str = ref_str.strip()
     
-    # Support name@sha256:digest format  
-    if "@" in ref_str and "sha256:" in ref_str.split("@", 1)[1]:
-        name, digest = ref_str.split("@", 1)
+    # Support name@sha256:digest format (partitioned once at the first @)
+    name, at, digest = ref_str.partition("@")
+    if at and "sha256:" in digest:
         if not name:  # Empty name before @ - this is a bare digest
             raise ValueError("Bare digests not supported. Use name@sha256:<digest>")
         return BundleRef(name=name, digest=digest.lower())
     
+    first = ref_str[:1]
+    
     # Reject bare digests
-    elif ref_str.startswith("sha256:") or ref_str.startswith("@sha256:"):
+    if ref_str.startswith("sha256:"):
         raise ValueError("Bare digests not supported. Use name@sha256:<digest>")
     
-    # Local paths - Windows paths need special handling due to colon
-    elif os.path.isabs(ref_str):
+    # Local paths - dispatch on the leading characters instead of os.path.isabs
+    # (/abs, \abs and UNC, ./rel, ../rel, and Windows drives C:\path or C:/path)
+    if first in ("/", "\\"):
         return BundleRef(local_path=ref_str)
-    elif ref_str.startswith("./") or ref_str.startswith("../") or ref_str.startswith(".\\") or ref_str.startswith("..\\"):
+    if first == "." and ref_str.startswith(_REL_PREFIXES):
         return BundleRef(local_path=ref_str)
-    # Windows absolute paths like C:\path or C:/path
-    elif len(ref_str) >= 3 and ref_str[1] == ":" and ref_str[0].isalpha():
+    if len(ref_str) >= 3 and ref_str[1] == ":" and first.isalpha():
         return BundleRef(local_path=ref_str)
     
     # name:version format
-    elif ":" in ref_str:
-        name, version = ref_str.split(":", 1)
+    name, colon, version = ref_str.partition(":")
+    if colon:
         return BundleRef(name=name, version=version)
     
     raise ValueError(f"Invalid bundle reference format: {ref_str}")
 
-def _create_provider(provider_name: Optional[str] = None) -> Optional[ContentProvider]:
+@functools.lru_cache(maxsize=1)
+def _fake_provider_class():
+    """
+    Locate the test-only FakeProvider class once per process.
+    
+    Tries the tests package first, then loads tests/fakes/fake_provider.py
+    from the working directory by file location (for runs outside pytest)
+    without adding anything to sys.path.
+    
+    Returns:
+        FakeProvider class, or None if unavailable
+    """
+    # Import here to avoid dependency on test code
+    try:
+        from tests.fakes.fake_provider import FakeProvider
+        return FakeProvider
+    except ImportError:
+        pass
+    
+    import os
+    import importlib.util
+    
+    spec = importlib.util.spec_from_file_location(
+        "fakes.fake_provider", os.path.join(os.getcwd(), "tests", "fakes", "fake_provider.py")
+    )
+    if spec is None or spec.loader is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except (ImportError, OSError):
+        return None
+    return module.FakeProvider
+
+def _create_provider(provider_name: Optional[str] = None,
+                     context: Optional[CLIContext] = None) -> Optional[ContentProvider]:
     """
     Create content provider for operations.
     
     Args:
         provider_name: Provider type override for testing
+        context: CLI context whose settings and registry the real provider
+            should share (if None, both are loaded from environment)
         
     Returns:
         Content provider instance or None for resolve-only operations
     """
     if provider_name == "fake":
-        # Import here to avoid dependency on test code
-        try:
-            from tests.fakes.fake_provider import FakeProvider
-            return FakeProvider()
-        except ImportError:
-            # Try alternate path for tests run outside pytest
-            try:
-                import sys
-                import os
-                sys.path.insert(0, os.path.join(os.getcwd(), 'tests'))
-                from fakes.fake_provider import FakeProvider
-                return FakeProvider()
-            except ImportError:
-                typer.echo("Warning: FakeProvider not available, using real provider")
+        fake_provider_cls = _fake_provider_class()
+        if fake_provider_cls is not None:
+            return fake_provider_cls()
+        typer.echo("Warning: FakeProvider not available, using real provider")
     
     # Use real provider for production
     from .providers.bundle_content import create_provider_from_env
-    return create_provider_from_env()
+    if context is None:
+        return create_provider_from_env()
+    return create_provider_from_env(settings=context.settings, registry=context.registry)
 
+def _fake_settings():
+    """Create Settings pointing at the fake registry used with --provider fake."""
+    from .settings import Settings
+    return Settings(
+        registry_url="http://fake-registry:5000",
+        registry_repo="testns"
+    )
+
+@functools.lru_cache(maxsize=1)
 def _create_fake_registry():
     """
     Create FakeOrasBundleRegistry for testing.
     
+    The registry is seeded once and shared by every fake-mode command in the
+    process. Fake-mode commands only read from it, and re-seeding is
+    idempotent (same blobs, same digests), so sharing is safe.
+    
     Returns:
         FakeOrasBundleRegistry instance with seeded test data, or None if unavailable
     """
@@ -125,20 +173,21 @@ def _create_fake_registry():
         typer.echo("Warning: FakeOrasBundleRegistry not available")
         return None
 
-def _add_fake_manifests_oras(fake_registry):
-    """Add fake manifests to FakeOrasBundleRegistry for testing."""
-    import json
-    import hashlib
+@functools.lru_cache(maxsize=1)
+def _fake_manifest_payloads():
+    """
+    Build the canonical fake bundle payloads once per process.
     
-    # Import OCI helper
-    try:
-        from tests.helpers.oci_helpers import setup_fake_bundle_in_registry, create_oci_image_manifest
-    except ImportError:
-        # Fallback if helpers not available
-        typer.echo("Warning: OCI helpers not available for fake registry setup")
-        return
+    The fake bundle content is constant, so the JSON canonicalization and
+    SHA-256 digests are computed on first use and shared afterwards. The
+    returned containers are shared; callers must not mutate them.
     
-    repo = "testns/bundles/bundle"
+    Returns:
+        Tuple of (layer_blobs, bundle_manifest, oci_manifest_bytes)
+    """
+    import json
+    import hashlib
+    from tests.helpers.oci_helpers import create_oci_image_manifest
     
     # Create layer indexes and blobs
     layer_blobs = {}
@@ -206,10 +255,33 @@ def _add_fake_manifests_oras(fake_registry):
             "runtime": ["code"],
             "training": ["code", "config", "data"]
         },
-        "layers": list(layer_indexes.keys()),  # List of layer names
+        "layers": list(layer_indexes),  # Layer names, in insertion order
         "layer_indexes": layer_indexes,
         "external_index_present": True
     }
+    bundle_manifest_bytes = json.dumps(bundle_manifest, sort_keys=True, separators=(',', ':')).encode()
+    oci_manifest_bytes = create_oci_image_manifest(bundle_manifest_bytes)
+    
+    return layer_blobs, bundle_manifest, oci_manifest_bytes
+
+def _add_fake_manifests_oras(fake_registry):
+    """
+    Add fake manifests to FakeOrasBundleRegistry for testing.
+    
+    The payloads are built once per process by _fake_manifest_payloads();
+    seeding itself goes through the shared test helper so the CLI and the
+    tests lay out fake bundles the same way.
+    """
+    # Import OCI helper
+    try:
+        from tests.helpers.oci_helpers import setup_fake_bundle_in_registry
+        layer_blobs, bundle_manifest, oci_manifest_bytes = _fake_manifest_payloads()
+    except ImportError:
+        # Fallback if helpers not available
+        typer.echo("Warning: OCI helpers not available for fake registry setup")
+        return
+    
+    repo = "testns/bundles/bundle"
     
     # Set up bundle using helper
     setup_fake_bundle_in_registry(
@@ -221,10 +293,149 @@ def _add_fake_manifests_oras(fake_registry):
     )
     
     # Also tag with "1.0.0" for compatibility
-    bundle_manifest_bytes = json.dumps(bundle_manifest, sort_keys=True, separators=(',', ':')).encode()
-    oci_manifest_bytes = create_oci_image_manifest(bundle_manifest_bytes)
     fake_registry.put_manifest(repo, "application/vnd.oci.image.manifest.v1+json", oci_manifest_bytes, "1.0.0")
 
+# Fake external objects seeded for --provider fake: uri -> (content, sha256)
+_FAKE_EXTERNAL_OBJECTS = {
+    "az://fake-container/train.csv": (
+        b"fake,train,data\nrow1,val1,100\nrow2,val2,200",
+        "e9f49fe13266597450605c421b38a8656e84216ff9c761ea1cd6720c563aeae8",
+    ),
+    "az://fake-container/test.csv": (
+        b"fake,test,data\nrow1,val1,50",
+        "af26f456bb5bd8b1ec12187c7d5968040715d79a773f7f81c5945174e923ced4",
+    ),
+}
+
+def _registry_and_settings(provider_name: Optional[str]):
+    """
+    Select the registry and settings a command should use.
+    
+    With --provider fake, the shared fake registry and fake settings are
+    returned. Otherwise (or if the fake registry is unavailable) a CLI
+    context is built from the environment.
+    
+    Args:
+        provider_name: Provider override ("fake" for testing)
+        
+    Returns:
+        Tuple of (registry, settings, context); context is None in fake mode
+    """
+    from .cli_context import CLIContext
+    
+    if provider_name == "fake":
+        registry = _create_fake_registry()
+        if registry is not None:
+            return registry, _fake_settings(), None
+    
+    # Production path (or fallback to real context)
+    context = CLIContext.from_env()
+    return context.registry, context.settings, context
+
+def _make_ops(config: OpsConfig, provider_name: Optional[str] = None) -> Operations:
+    """
+    Build an Operations facade without a content provider.
+    
+    Used by every command except materialize/pull, which also need a
+    content provider (see _build_materialize_ops).
+    
+    Args:
+        config: Operations configuration
+        provider_name: Provider override ("fake" for testing)
+        
+    Returns:
+        Operations facade with registry and settings configured
+    """
+    from .operations import Operations
+    
+    registry, settings, _ = _registry_and_settings(provider_name)
+    return Operations(config=config, registry=registry, settings=settings)
+
+def _build_materialize_ops(config: OpsConfig, provider_name: Optional[str]) -> Operations:
+    """
+    Build an Operations facade with a content provider for materialize/pull.
+    
+    Args:
+        config: Operations configuration
+        provider_name: Provider override ("fake" for testing)
+        
+    Returns:
+        Operations facade with provider, registry, and settings configured
+    """
+    from .operations import Operations
+    
+    registry, settings, context = _registry_and_settings(provider_name)
+    
+    if context is not None:
+        # Real provider sharing the context's settings and registry
+        content_provider = _create_provider(context=context)
+    else:
+        # Use fake external store
+        try:
+            from tests.storage.fakes.fake_external import FakeExternalStore
+            external = FakeExternalStore()
+            
+            # Seed fake external data
+            for uri, (data, sha256) in _FAKE_EXTERNAL_OBJECTS.items():
+                external.put(uri, data, sha256=sha256)
+        except ImportError:
+            from .storage.object_store import AzureExternalAdapter
+            external = AzureExternalAdapter(settings=settings)
+        
+        from .providers.bundle_content import BundleContentProvider
+        content_provider = BundleContentProvider(
+            registry=registry, 
+            external=external,
+            settings=settings
+        )
+    
+    return Operations(
+        config=config,
+        provider=content_provider,
+        registry=registry,
+        settings=settings
+    )
+
+def _run_materialize_like(op_name: str, bundle_ref: str, dest: str, *,
+                          role: Optional[str], overwrite: bool,
+                          prefetch_external: bool, no_cache: bool, ci: bool,
+                          provider: Optional[str], verbose: bool) -> None:
+    """
+    Shared body of the materialize and pull commands.
+    
+    Args:
+        op_name: Operations method to dispatch to ("materialize" or "pull")
+        bundle_ref: Bundle reference string
+        dest: Destination directory
+        role: Role to materialize
+        overwrite: Overwrite existing files
+        prefetch_external: Download external data immediately
+        no_cache: Disable bundle caching
+        ci: CI mode (suppress progress)
+        provider: Provider override ("fake" for testing)
+        verbose: Show detailed output
+    """
+    from .operations import OpsConfig, run_and_exit
+    from .operations.printers import print_materialize_summary
+    
+    def _run() -> None:
+        ref = _parse_bundle_ref(bundle_ref)
+        config = OpsConfig(cache=not no_cache, ci=ci, verbose=verbose)
+        
+        ops = _build_materialize_ops(config, provider)
+        
+        result = getattr(ops, op_name)(
+            ref=ref,
+            dest=dest,
+            role=role,
+            overwrite=overwrite,
+            prefetch_external=prefetch_external
+        )
+        
+        print_materialize_summary(result.bundle, result.dest_path, result.selected_role)
+    
+    run_and_exit(_run)
+
 @app.command()
 def resolve(
     bundle_ref: str = typer.Argument(..., help="Bundle reference to resolve"),
@@ -233,29 +444,14 @@ def resolve(
     verbose: bool = typer.Option(False, "--verbose", help="Show detailed output")
 ) -> None:
     """Resolve bundle identity without side effects."""
+    from .operations import OpsConfig, run_and_exit
+    from .operations.printers import print_resolved_bundle
     
     def _resolve() -> None:
         ref = _parse_bundle_ref(bundle_ref)
         config = OpsConfig(cache=not no_cache, verbose=verbose)
         
-        if provider == "fake":
-            # Use fake registry for testing
-            registry = _create_fake_registry()
-            from .settings import Settings
-            settings = Settings(
-                registry_url="http://fake-registry:5000",
-                registry_repo="testns"
-            )
-            if registry is None:
-                # Fallback to real context
-                context = CLIContext.from_env()
-                registry = context.registry
-                settings = context.settings
-            ops = Operations(config=config, registry=registry, settings=settings)
-        else:
-            # Production path - use CLI context
-            context = CLIContext.from_env()
-            ops = Operations(config=config, registry=context.registry, settings=context.settings)
+        ops = _make_ops(config, provider)
         
         resolved = ops.resolve(ref)
         print_resolved_bundle(resolved, verbose=verbose)
@@ -275,80 +471,11 @@ def materialize(
     verbose: bool = typer.Option(False, "--verbose", help="Show detailed output")
 ) -> None:
     """Materialize bundle layers to filesystem."""
-    
-    def _materialize() -> None:
-        ref = _parse_bundle_ref(bundle_ref)
-        config = OpsConfig(cache=not no_cache, ci=ci, verbose=verbose)
-        
-        if provider == "fake":
-            # Use fake registry and external store for testing
-            registry = _create_fake_registry()
-            from .settings import Settings
-            settings = Settings(
-                registry_url="http://fake-registry:5000",
-                registry_repo="testns"
-            )
-            
-            if registry is None:
-                # Fallback to real context
-                context = CLIContext.from_env()
-                registry = context.registry
-                settings = context.settings
-                # Create real provider
-                from .providers.bundle_content import create_provider_from_env
-                content_provider = create_provider_from_env()
-            else:
-                # Use fake external store
-                try:
-                    from tests.storage.fakes.fake_external import FakeExternalStore
-                    external = FakeExternalStore()
-                    
-                    # Seed fake external data
-                    train_data = b"fake,train,data\nrow1,val1,100\nrow2,val2,200"
-                    test_data = b"fake,test,data\nrow1,val1,50"
-                    external.put("az://fake-container/train.csv", train_data, sha256="e9f49fe13266597450605c421b38a8656e84216ff9c761ea1cd6720c563aeae8")
-                    external.put("az://fake-container/test.csv", test_data, sha256="af26f456bb5bd8b1ec12187c7d5968040715d79a773f7f81c5945174e923ced4")
-                except ImportError:
-                    from .storage.object_store import AzureExternalAdapter
-                    external = AzureExternalAdapter(settings=settings)
-                
-                from .providers.bundle_content import BundleContentProvider
-                content_provider = BundleContentProvider(
-                    registry=registry, 
-                    external=external,
-                    settings=settings
-                )
-            
-            ops = Operations(
-                config=config,
-                provider=content_provider,
-                registry=registry,
-                settings=settings
-            )
-        else:
-            # Production path - use CLI context and provider factory
-            context = CLIContext.from_env()
-            from .providers.bundle_content import create_provider_from_env
-            content_provider = create_provider_from_env()
-            
-            ops = Operations(
-                config=config,
-                provider=content_provider,
-                registry=context.registry,
-                settings=context.settings
-            )
-        
-        result = ops.materialize(
-            ref=ref,
-            dest=dest,
-            role=role,
-            overwrite=overwrite,
-            prefetch_external=prefetch_external
-        )
-        
-        print_materialize_summary(result.bundle, result.dest_path, result.selected_role)
-    
-    run_and_exit(_materialize)
+    _run_materialize_like(
+        "materialize", bundle_ref, dest, role=role, overwrite=overwrite,
+        prefetch_external=prefetch_external, no_cache=no_cache, ci=ci,
+        provider=provider, verbose=verbose
+    )
 
 @app.command()
 def pull(
@@ -363,80 +490,22 @@ def pull(
     verbose: bool = typer.Option(False, "--verbose", help="Show detailed output")
 ) -> None:
     """Pull bundle (alias for materialize)."""
-    
-    def _pull() -> None:
-        ref = _parse_bundle_ref(bundle_ref)
-        config = OpsConfig(cache=not no_cache, ci=ci, verbose=verbose)
-        
-        if provider == "fake":
-            # Use fake registry and external store for testing
-            registry = _create_fake_registry()
-            from .settings import Settings
-            settings = Settings(
-                registry_url="http://fake-registry:5000",
-                registry_repo="testns"
-            )
-            
-            if registry is None:
-                # Fallback to real context
-                context = CLIContext.from_env()
-                registry = context.registry
-                settings = context.settings
-                # Create real provider
-                from .providers.bundle_content import create_provider_from_env
-                content_provider = create_provider_from_env()
-            else:
-                # Use fake external store
-                try:
-                    from tests.storage.fakes.fake_external import FakeExternalStore
-                    external = FakeExternalStore()
-                    
-                    # Seed fake external data
-                    train_data = b"fake,train,data\nrow1,val1,100\nrow2,val2,200"
-                    test_data = b"fake,test,data\nrow1,val1,50"
-                    external.put("az://fake-container/train.csv", train_data, sha256="e9f49fe13266597450605c421b38a8656e84216ff9c761ea1cd6720c563aeae8")
-                    external.put("az://fake-container/test.csv", test_data, sha256="af26f456bb5bd8b1ec12187c7d5968040715d79a773f7f81c5945174e923ced4")
-                except ImportError:
-                    from .storage.object_store import AzureExternalAdapter
-                    external = AzureExternalAdapter(settings=settings)
-                
-                from .providers.bundle_content import BundleContentProvider
-                content_provider = BundleContentProvider(
-                    registry=registry, 
-                    external=external,
-                    settings=settings
-                )
-            
-            ops = Operations(
-                config=config,
-                provider=content_provider,
-                registry=registry,
-                settings=settings
-            )
-        else:
-            # Production path - use CLI context and provider factory
-            context = CLIContext.from_env()
-            from .providers.bundle_content import create_provider_from_env
-            content_provider = create_provider_from_env()
-            
-            ops = Operations(
-                config=config,
-                provider=content_provider,
-                registry=context.registry,
-                settings=context.settings
-            )
-        
-        result = ops.pull(
-            ref=ref,
-            dest=dest,
-            role=role,
-            overwrite=overwrite,
-            prefetch_external=prefetch_external
-        )
-        
-        print_materialize_summary(result.bundle, result.dest_path, result.selected_role)
-    
-    run_and_exit(_pull)
+    _run_materialize_like(
+        "pull", bundle_ref, dest, role=role, overwrite=overwrite,
+        prefetch_external=prefetch_external, no_cache=no_cache, ci=ci,
+        provider=provider, verbose=verbose
+    )
+
+# --compression choice -> (default archive extension, use zstd)
+_COMPRESSION_FORMATS = {
+    "zstd": ("tar.zst", True),
+    "none": ("tar", False),
+}
+
+def _basename(path: str) -> str:
+    """Return the final component of a / or \\ separated path."""
+    i = max(path.rfind("/"), path.rfind("\\"))
+    return path[i + 1:] if i >= 0 else path
 
 @app.command()
 def export(
@@ -446,30 +515,32 @@ def export(
     include_external: bool = typer.Option(False, "--include-external", help="Include external data bytes")
 ) -> None:
     """Export materialized workdir to deterministic archive."""
+    from .operations import run_and_exit
+    from .operations.printers import print_export_summary
     
     def _export() -> None:
         # Validate and map compression format
-        compression_map = {
-            "zstd": ("tar.zst", True),
-            "none": ("tar", False)
-        }
-        
-        if compression not in compression_map:
+        if compression not in _COMPRESSION_FORMATS:
             raise typer.BadParameter(f"Invalid compression '{compression}'. Use 'zstd' or 'none'.")
         
-        ext, use_compression = compression_map[compression]
+        ext, use_compression = _COMPRESSION_FORMATS[compression]
         
         # Generate output path if not provided
         if out_path is None:
-            src_name = Path(src_dir).name or "archive"
+            src_name = _basename(src_dir.rstrip("/\\"))
+            if src_name in ("", "."):
+                src_name = "archive"
             final_out_path = f"{src_name}.{ext}"
         else:
             final_out_path = out_path
-            # Validate extension matches compression choice
-            if use_compression and not final_out_path.endswith(('.tar.zst', '.zst')):
-                raise typer.BadParameter(f"With --compression zstd, output path must end with .tar.zst or .zst")
-            elif not use_compression and not final_out_path.endswith('.tar'):
-                raise typer.BadParameter(f"With --compression none, output path must end with .tar")
+            # Validate extension matches compression choice (.tar.zst ends in .zst,
+            # so the last suffix alone decides)
+            dot = final_out_path.rfind(".")
+            suffix = final_out_path[dot:] if dot >= 0 else ""
+            if use_compression and suffix != ".zst":
+                raise typer.BadParameter("With --compression zstd, output path must end with .tar.zst or .zst")
+            elif not use_compression and suffix != ".tar":
+                raise typer.BadParameter("With --compression none, output path must end with .tar")
         
         # Export doesn't need registry access, so call directly
         from modelops_bundles.export import write_deterministic_archive
@@ -478,7 +549,7 @@ def export(
             src_dir=src_dir,
             out_path=final_out_path,
             include_external=include_external,
-            zstd_level=19  # Fixed level for determinism
+            zstd_level=15  # Fixed level for determinism (OpsConfig.zstd_level)
         )
         
         print_export_summary(src_dir, final_out_path, include_external)
@@ -490,12 +561,12 @@ def scan(
     working_dir: str = typer.Argument(".", help="Directory to scan")
 ) -> None:
     """Scan working directory for bundle configuration."""
+    from .operations import OpsConfig, run_and_exit
+    from .operations.printers import print_stub_message
     
     def _scan() -> None:
         config = OpsConfig()
-        # Use CLI context for consistency
-        context = CLIContext.from_env()
-        ops = Operations(config=config, registry=context.registry, settings=context.settings)
+        ops = _make_ops(config)
         
         result = ops.scan(working_dir)
         print_stub_message("scan")
@@ -509,12 +580,12 @@ def plan(
     external_preview: bool = typer.Option(False, "--external-preview", help="Preview external storage decisions")
 ) -> None:
     """Show storage plan for bundle creation."""
+    from .operations import OpsConfig, run_and_exit
+    from .operations.printers import print_stub_message
     
     def _plan() -> None:
         config = OpsConfig()
-        # Use CLI context for consistency
-        context = CLIContext.from_env()
-        ops = Operations(config=config, registry=context.registry, settings=context.settings)
+        ops = _make_ops(config)
         
         result = ops.plan(working_dir, external_preview=external_preview)
         print_stub_message("plan")
@@ -527,12 +598,12 @@ def diff(
     ref_or_path: str = typer.Argument(..., help="Bundle reference or local path")
 ) -> None:
     """Compare bundle or working directory."""
+    from .operations import OpsConfig, run_and_exit
+    from .operations.printers import print_stub_message
     
     def _diff() -> None:
         config = OpsConfig()
-        # Use CLI context for consistency
-        context = CLIContext.from_env()
-        ops = Operations(config=config, registry=context.registry, settings=context.settings)
+        ops = _make_ops(config)
         
         result = ops.diff(ref_or_path)
         print_stub_message("diff")
@@ -548,17 +619,12 @@ def push(
     force: bool = typer.Option(False, "--force", help="Skip change detection and always push")
 ) -> None:
     """Push bundle to registry."""
+    from .operations import OpsConfig, run_and_exit
+    from .operations.printers import print_push_summary
     
     def _push() -> None:
         config = OpsConfig()
-        
-        # Use CLI context
-        context = CLIContext.from_env()
-        ops = Operations(
-            config=config,
-            registry=context.registry,
-            settings=context.settings
-        )
+        ops = _make_ops(config)
         
         # Push bundle - this now returns a digest
         digest = ops.push(working_dir, bump=bump, dry_run=dry_run, force=force)
@@ -7,10 +7,13 @@ instances, avoiding global state and enabling proper dependency injection.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from functools import cached_property
+from typing import TYPE_CHECKING
 
 from .settings import Settings, create_settings_from_env
-from .storage.oras_bundle_registry import OrasBundleRegistry
+
+if TYPE_CHECKING:
+    from .storage.oras_bundle_registry import OrasBundleRegistry
 
 
 @dataclass
@@ -25,7 +28,6 @@ class CLIContext:
     injection for CLI commands.
     """
     settings: Settings
-    _registry: Optional[OrasBundleRegistry] = None
     
     @classmethod
     def from_env(cls) -> CLIContext:
@@ -38,17 +40,18 @@ class CLIContext:
         settings = create_settings_from_env()
         return cls(settings=settings)
     
-    @property
+    @cached_property
     def registry(self) -> OrasBundleRegistry:
         """
         Get or create registry instance (lazy initialization).
         
         The registry is created on first access and reused for subsequent calls.
         This avoids creating multiple registry instances within a single CLI command.
+        The ORAS client is only imported at that point, so commands that never
+        touch the registry do not load it.
         
         Returns:
             OrasBundleRegistry instance
         """
-        if self._registry is None:
-            self._registry = OrasBundleRegistry(self.settings)
-        return self._registry
\ No newline at end of file
+        from .storage.oras_bundle_registry import OrasBundleRegistry
+        return OrasBundleRegistry(self.settings)
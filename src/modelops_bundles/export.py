@@ -7,20 +7,33 @@ cross-platform compatibility.
 """
 from __future__ import annotations
 
+import io
 import os
+import stat
+import struct
+import sys
 import tarfile
 import tempfile
 import unicodedata
-import zstandard as zstd
 from pathlib import Path
-from typing import Iterator, Tuple, Set
+from typing import Iterator, Optional, Tuple, Set
 import json
 
 from .path_safety import safe_relpath
 
+# Optional faster parser for the many small pointer documents (resolved once,
+# not per export)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Buffer size for archive output; tar headers and padding are 512-byte writes
+_WRITE_BUFFER_SIZE = 1 << 20
+
 def write_deterministic_archive(src_dir: str, out_path: str, *,
                                 include_external: bool = False,
-                                zstd_level: int = 19) -> None:
+                                zstd_level: int = 15) -> None:
     """
     Create deterministic tar archive from source directory.
     
@@ -35,17 +48,23 @@ def write_deterministic_archive(src_dir: str, out_path: str, *,
         src_dir: Source directory to archive
         out_path: Output archive path (.tar or .tar.zst)
         include_external: Include external data files (vs pointer files only)
-        zstd_level: Zstandard compression level (19 for max determinism)
+        zstd_level: Zstandard compression level (pinned; output bytes depend on it)
         
     Raises:
         ValueError: If src_dir doesn't exist or contains unsafe paths
         OSError: If archive creation fails
     """
-    src_path = Path(src_dir).resolve()
-    if not src_path.is_dir():
+    # realpath plus one stat, instead of Path.resolve() and is_dir(); the
+    # resolved source is passed down as a plain string
+    src_path = os.path.realpath(src_dir)
+    try:
+        src_is_dir = stat.S_ISDIR(os.stat(src_path).st_mode)
+    except OSError:
+        src_is_dir = False
+    if not src_is_dir:
         raise ValueError(f"Source directory does not exist: {src_dir}")
     
-    out_path = Path(out_path).resolve()
+    out_dir, out_name = os.path.split(os.path.realpath(out_path))
     
     # Use atomic writes via temp file
     temp_fd = None
@@ -55,11 +74,12 @@ def write_deterministic_archive(src_dir: str, out_path: str, *,
         # Create temporary file in same directory as output for atomic rename
         temp_fd, temp_path = tempfile.mkstemp(
             suffix='.tmp', 
-            dir=out_path.parent,
-            prefix=out_path.name + '.'
+            dir=out_dir,
+            prefix=out_name + '.'
         )
         
-        if out_path.suffix == '.zst' or out_path.name.endswith('.tar.zst'):
+        # ".zst" alone is a dotfile name, not a .zst suffix
+        if out_name.endswith('.zst') and out_name != '.zst':
             _write_zst_archive(temp_fd, src_path, include_external, zstd_level)
         else:
             _write_tar_archive(temp_fd, src_path, include_external)
@@ -68,7 +88,7 @@ def write_deterministic_archive(src_dir: str, out_path: str, *,
         temp_fd = None
         
         # Atomic rename to final path
-        os.rename(temp_path, out_path)
+        os.rename(temp_path, os.path.join(out_dir, out_name))
         temp_path = None
         
     except Exception:
@@ -85,35 +105,57 @@ def write_deterministic_archive(src_dir: str, out_path: str, *,
                 pass
         raise
 
-def _write_tar_archive(fd: int, src_path: Path, include_external: bool) -> None:
-    """Write uncompressed tar archive to file descriptor."""
-    with os.fdopen(os.dup(fd), 'wb') as f:
+# os.sendfile only writes to regular files on Linux; macOS and the BSDs
+# require a socket target (ENOTSOCK). Same gate as shutil's copy fast path.
+_USE_FILE_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+
+def _write_tar_archive(fd: int, src_path: str, include_external: bool) -> None:
+    """Write uncompressed tar archive to file descriptor (left open for the caller)."""
+    with os.fdopen(fd, 'wb', buffering=_WRITE_BUFFER_SIZE, closefd=False) as f:
         with tarfile.open(fileobj=f, mode='w', format=tarfile.USTAR_FORMAT) as tar:
-            _add_entries_to_tar(tar, src_path, include_external)
+            # The archive goes straight to a file, so file bodies can be
+            # copied in-kernel with sendfile where it supports file targets
+            out_fd = f.fileno() if _USE_FILE_SENDFILE else None
+            _add_entries_to_tar(tar, src_path, include_external, out_fd=out_fd)
 
-def _write_zst_archive(fd: int, src_path: Path, include_external: bool, zstd_level: int) -> None:
-    """Write zstandard-compressed tar archive to file descriptor."""
-    with os.fdopen(os.dup(fd), 'wb') as f:
-        # Configure zstd for deterministic output
+def _write_zst_archive(fd: int, src_path: str, include_external: bool, zstd_level: int) -> None:
+    """Write zstandard-compressed tar archive to file descriptor (left open for the caller)."""
+    # Imported here so plain .tar exports and importers of this module do not
+    # load the zstandard C extension
+    import zstandard as zstd
+    
+    with os.fdopen(fd, 'wb', closefd=False) as f:
+        # Configure zstd for deterministic output. threads=-1 runs libzstd's
+        # multithreaded mode with one worker per CPU; its output depends only
+        # on the level and input, not on the worker count, so archives stay
+        # byte-identical across machines with different core counts
         compressor = zstd.ZstdCompressor(
             level=zstd_level,
             write_content_size=True,
-            write_checksum=True
+            write_checksum=True,
+            threads=-1
         )
         
         with compressor.stream_writer(f) as zstd_writer:
-            with tarfile.open(fileobj=zstd_writer, mode='w', format=tarfile.USTAR_FORMAT) as tar:
-                _add_entries_to_tar(tar, src_path, include_external)
+            # Coalesce tarfile's many small header/padding writes before they
+            # reach the compressor; closing the buffer ends the zstd frame
+            with io.BufferedWriter(zstd_writer, buffer_size=_WRITE_BUFFER_SIZE) as buffered:
+                with tarfile.open(fileobj=buffered, mode='w', format=tarfile.USTAR_FORMAT) as tar:
+                    _add_entries_to_tar(tar, src_path, include_external)
 
-def _collect_pointer_targets(root: Path) -> Set[str]:
+def _collect_pointer_targets(root: str) -> Set[str]:
     """Collect paths that have corresponding pointer files."""
-    ptr_root = root / ".mops" / "ptr"
+    ptr_root = Path(root, ".mops", "ptr")
     targets: Set[str] = set()
     if not ptr_root.exists():
         return targets
+    
     for p in ptr_root.rglob("*.json"):
         try:
-            data = json.loads(p.read_text(encoding="utf-8"))
+            # Parse fully (not a regex scan) so malformed pointers are
+            # still recognised as such and never exclude anything
+            raw = p.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw.decode("utf-8"))
             original = data.get("original_path")
             if isinstance(original, str):
                 targets.add(normalize_relpath(original))
@@ -122,69 +164,272 @@ def _collect_pointer_targets(root: Path) -> Set[str]:
             pass
     return targets
 
-def _add_entries_to_tar(tar: tarfile.TarFile, src_path: Path, include_external: bool) -> None:
-    """Add directory entries to tar archive in deterministic order."""
-    pointer_targets = set()
+def _add_entries_to_tar(tar: tarfile.TarFile, src_path: str, include_external: bool,
+                        out_fd: Optional[int] = None) -> None:
+    """
+    Add directory entries to tar archive in deterministic order.
+    
+    Args:
+        tar: Archive being written
+        src_path: Source directory
+        include_external: Include external data files (vs pointer files only)
+        out_fd: File descriptor backing tar.fileobj, if regular file bodies
+            may be copied into it directly with os.sendfile
+    """
+    pointer_targets = frozenset()
     if not include_external:
-        pointer_targets = _collect_pointer_targets(src_path)
+        pointer_targets = frozenset(_collect_pointer_targets(src_path))
     
-    for entry_path, arcname in _iter_entries_sorted(src_path):
+    for entry, arcname in _iter_entries_sorted(src_path):
         # Keep pointer files always; optionally skip the actual bytes
-        if not include_external:
-            rel = normalize_relpath(str(entry_path.relative_to(src_path)))
-            if rel in pointer_targets:
-                continue
-            
-        # Validate path safety for archive creation
-        try:
-            _validate_archive_path(arcname)
-        except ValueError as e:
-            raise ValueError(f"Unsafe archive path {arcname}: {e}")
+        # (arcname is the normalized relative path, already validated by
+        # normalize_relpath during the walk)
+        if not include_external and arcname in pointer_targets:
+            continue
+        
+        # Reuse the lstat cached on the scandir entry instead of having
+        # tar.gettarinfo() stat the file again
+        st = entry.stat(follow_symlinks=False)
         
         # Ensure directory names end with "/" for canonical tars
-        arc = arcname + ("/" if entry_path.is_dir() and not arcname.endswith("/") else "")
-        tarinfo = tar.gettarinfo(str(entry_path), arcname=arc)
+        arc = arcname + ("/" if stat.S_ISDIR(st.st_mode) and not arcname.endswith("/") else "")
+        tarinfo = _tarinfo_from_stat(tar, st, entry.path, arc)
+        if tarinfo is None:
+            # Sockets and other unsupported types, as in tarfile.add()
+            continue
         _apply_canonical_headers(tarinfo)
         
         if tarinfo.isreg():
-            with open(entry_path, 'rb') as entry_file:
-                tar.addfile(tarinfo, entry_file)
+            with open(entry.path, 'rb') as entry_file:
+                _addfile(tar, tarinfo, entry_file, out_fd)
         else:
-            tar.addfile(tarinfo)
+            _addfile(tar, tarinfo)
 
-def _iter_entries_sorted(src_dir: Path) -> Iterator[Tuple[Path, str]]:
+def _addfile(tar: tarfile.TarFile, tarinfo: tarfile.TarInfo,
+             entry_file=None, out_fd: Optional[int] = None) -> None:
+    """
+    Append a member to the archive, bypassing tar.addfile().
+    
+    Writes the same bytes as tar.addfile(tarinfo, entry_file): the header,
+    the file body, and NUL padding to the next block boundary. The header
+    comes from _tar_header, and when out_fd is given the body is moved
+    in-kernel with os.sendfile instead of through Python-level buffers.
+    
+    Args:
+        tar: Archive being written
+        tarinfo: Canonicalized member header
+        entry_file: Open source file for regular files, else None
+        out_fd: File descriptor underlying tar.fileobj, if the body may be
+            copied with os.sendfile
+        
+    Raises:
+        OSError: If the source file is shorter than tarinfo.size
+    """
+    buf = _tar_header(tar, tarinfo)
+    tar.fileobj.write(buf)
+    tar.offset += len(buf)
+    
+    size = tarinfo.size if entry_file is not None else 0
+    if out_fd is not None and size:
+        # Drain buffered header bytes before writing to the fd directly
+        tar.fileobj.flush()
+        src_fd = entry_file.fileno()
+        copied = 0
+        while copied < size:
+            sent = os.sendfile(out_fd, src_fd, copied, size - copied)
+            if sent == 0:
+                raise OSError("unexpected end of data")
+            copied += sent
+    elif size:
+        remaining = size
+        while remaining:
+            chunk = entry_file.read(min(remaining, _WRITE_BUFFER_SIZE))
+            if not chunk:
+                raise OSError("unexpected end of data")
+            tar.fileobj.write(chunk)
+            remaining -= len(chunk)
+    
+    blocks, remainder = divmod(size, tarfile.BLOCKSIZE)
+    if remainder > 0:
+        tar.fileobj.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+        blocks += 1
+    tar.offset += blocks * tarfile.BLOCKSIZE
+    tar.members.append(tarinfo)
+
+# USTAR header layout: name, mode, uid, gid, size, mtime, chksum, typeflag,
+# linkname, magic, version, uname, gname, devmajor, devminor, prefix, padding
+_USTAR_HEADER = struct.Struct("100s8s8s8s12s12s8s1s100s6s2s32s32s8s8s155s12x")
+_ZERO_OCTAL_8 = b"0000000\0"
+_ZERO_OCTAL_12 = b"00000000000\0"
+_MAX_OCTAL_SIZE = 8 ** 11
+
+def _tar_header(tar: tarfile.TarFile, tarinfo: tarfile.TarInfo) -> bytes:
+    """
+    Build the USTAR header block for a canonicalized member.
+    
+    Entries written by this module have uid/gid/mtime 0 and empty owner
+    names, so the header is packed in one struct call with those fields
+    fixed. Anything the fixed layout does not cover (names over 100 bytes
+    that need the prefix field, device numbers, oversized files, or headers
+    that were not canonicalized) goes through tarinfo.tobuf(), which yields
+    the same bytes and raises the same errors as tarfile itself.
+    
+    Args:
+        tar: Archive being written (for format and name encoding)
+        tarinfo: Member header
+        
+    Returns:
+        The 512-byte header block
+    """
+    name = tarinfo.name
+    if tarinfo.type == tarfile.DIRTYPE and not name.endswith("/"):
+        name += "/"
+    name_b = name.encode(tar.encoding, tar.errors)
+    link_b = tarinfo.linkname.encode(tar.encoding, tar.errors)
+    if (len(name_b) > tarfile.LENGTH_NAME or len(link_b) > tarfile.LENGTH_LINK
+            or tarinfo.type in (tarfile.CHRTYPE, tarfile.BLKTYPE)
+            or not 0 <= tarinfo.size < _MAX_OCTAL_SIZE
+            or tarinfo.uid or tarinfo.gid or tarinfo.mtime
+            or tarinfo.uname or tarinfo.gname
+            or tar.format != tarfile.USTAR_FORMAT):
+        return tarinfo.tobuf(tar.format, tar.encoding, tar.errors)
+    
+    buf = _USTAR_HEADER.pack(
+        name_b,
+        b"%07o\0" % (tarinfo.mode & 0o7777),
+        _ZERO_OCTAL_8,
+        _ZERO_OCTAL_8,
+        b"%011o\0" % tarinfo.size,
+        _ZERO_OCTAL_12,
+        b"        ",
+        tarinfo.type,
+        link_b,
+        b"ustar\0",
+        b"00",
+        b"",
+        b"",
+        b"",
+        b"",
+        b"",
+    )
+    # The checksum is the byte sum of the header with its own field read as
+    # spaces, which is how it was packed above
+    chksum = sum(buf)
+    return buf[:148] + b"%06o\0" % chksum + buf[155:]
+
+def _tarinfo_from_stat(tar: tarfile.TarFile, st: os.stat_result, path: str,
+                       arcname: str) -> Optional[tarfile.TarInfo]:
+    """
+    Build a TarInfo from an lstat result, as tar.gettarinfo() would.
+    
+    Mirrors gettarinfo's type detection, including hardlink tracking via
+    tar.inodes, but skips the extra lstat and the pwd/grp owner lookups
+    (owner names are cleared by _apply_canonical_headers anyway).
+    
+    Args:
+        tar: Archive being written (for hardlink bookkeeping)
+        st: lstat result for the entry
+        path: Filesystem path of the entry (for reading symlink targets)
+        arcname: Archive name for the entry
+        
+    Returns:
+        TarInfo for the entry, or None for unsupported file types
+    """
+    mode = st.st_mode
+    linkname = ""
+    if stat.S_ISREG(mode):
+        inode = (st.st_ino, st.st_dev)
+        if st.st_nlink > 1 and inode in tar.inodes and arcname != tar.inodes[inode]:
+            # Hardlink to an already archived file
+            type_ = tarfile.LNKTYPE
+            linkname = tar.inodes[inode]
+        else:
+            type_ = tarfile.REGTYPE
+            if inode[0]:
+                tar.inodes[inode] = arcname
+    elif stat.S_ISDIR(mode):
+        type_ = tarfile.DIRTYPE
+    elif stat.S_ISFIFO(mode):
+        type_ = tarfile.FIFOTYPE
+    elif stat.S_ISLNK(mode):
+        type_ = tarfile.SYMTYPE
+        linkname = os.readlink(path)
+    elif stat.S_ISCHR(mode):
+        type_ = tarfile.CHRTYPE
+    elif stat.S_ISBLK(mode):
+        type_ = tarfile.BLKTYPE
+    else:
+        return None
+    
+    tarinfo = tar.tarinfo(arcname)
+    tarinfo.mode = mode
+    tarinfo.uid = st.st_uid
+    tarinfo.gid = st.st_gid
+    tarinfo.size = st.st_size if type_ == tarfile.REGTYPE else 0
+    tarinfo.mtime = st.st_mtime
+    tarinfo.type = type_
+    tarinfo.linkname = linkname
+    if type_ in (tarfile.CHRTYPE, tarfile.BLKTYPE) and hasattr(os, "major"):
+        tarinfo.devmajor = os.major(st.st_rdev)
+        tarinfo.devminor = os.minor(st.st_rdev)
+    return tarinfo
+
+def _iter_entries_sorted(src_dir: str) -> Iterator[Tuple[os.DirEntry, str]]:
     """
     Iterate entries in deterministic order.
     
-    Yields (filesystem_path, archive_name) pairs sorted by archive name.
+    Yields (scandir_entry, archive_name) pairs sorted by archive name.
     Directories are processed before their contents for tar compatibility.
     
+    Entries are streamed one directory at a time instead of being collected
+    and sorted up front, so memory stays proportional to the widest directory
+    rather than the whole tree. The os.DirEntry objects carry their cached
+    lstat result through to archive writing.
+    
     Args:
         src_dir: Source directory to iterate
         
     Yields:
-        (entry_path, archive_name) tuples
+        (entry, archive_name) tuples
+    """
+    yield from _iter_dir_sorted(src_dir, "")
+
+def _iter_dir_sorted(dir_path: str, prefix: str) -> Iterator[Tuple[os.DirEntry, str]]:
     """
-    entries = []
+    Yield the entries below one directory in global archive-name order.
     
-    for root, dirs, files in os.walk(src_dir):
-        root_path = Path(root)
-        rel_root = root_path.relative_to(src_dir)
-        
-        # Add directory entry (except for root)
-        if rel_root != Path('.'):
-            entries.append((root_path, normalize_relpath(str(rel_root))))
-        
-        # Add file entries
-        for file_name in files:
-            file_path = root_path / file_name
-            rel_file = file_path.relative_to(src_dir)
-            entries.append((file_path, normalize_relpath(str(rel_file))))
+    Each subdirectory contributes two sort keys: its own name (the directory
+    entry) and its name plus "/" (its contents). Everything below a directory
+    shares that "name/" prefix, so sorting siblings by these keys and recursing
+    at the contents key reproduces a sort over the full archive names.
+    
+    Args:
+        dir_path: Directory to list
+        prefix: Normalized archive name of dir_path plus "/" ("" for the root)
+    """
+    keyed = []
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                arcname = normalize_relpath(prefix + entry.name)
+                if entry.is_dir():
+                    # Like os.walk, symlinked directories are not followed
+                    if entry.is_symlink():
+                        continue
+                    keyed.append((arcname, entry, arcname, False))
+                    keyed.append((arcname + "/", entry, arcname, True))
+                else:
+                    keyed.append((arcname, entry, arcname, False))
+    except OSError:
+        return
     
-    # Sort by archive name for deterministic ordering
-    entries.sort(key=lambda x: x[1])
+    keyed.sort(key=lambda x: x[0])
     
-    yield from entries
+    for _, entry, arcname, is_contents in keyed:
+        if is_contents:
+            yield from _iter_dir_sorted(entry.path, arcname + "/")
+        else:
+            yield entry, arcname
 
 def normalize_relpath(path: str) -> str:
     """
@@ -225,25 +470,32 @@ def _validate_archive_path(path: str) -> None:
     Raises:
         ValueError: If path contains dangerous sequences
     """
-    from pathlib import PurePosixPath
-    
-    rel = PurePosixPath(path)
-    s = str(rel)
-    
-    # Basic safety checks
-    if not s or s == ".":
+    # Same checks as on PurePosixPath(path), done on the string directly since
+    # this runs for every archive entry: empty and "." components collapse
+    # away, so a path made only of them is "."
+    parts = path.split("/")
+    if not path or all(part in ("", ".") for part in parts):
         raise ValueError(f"unsafe archive path: {path}")
-    if "\\" in s:
+    if "\\" in path:
         raise ValueError(f"unsafe archive path: {path}")
-    if rel.is_absolute() or ".." in rel.parts:
+    if path[0] == "/" or ".." in parts:
         raise ValueError(f"unsafe archive path: {path}")
     
     # Security: Check for NUL bytes which can cause path truncation
-    if "\x00" in s:
+    if "\x00" in path:
         raise ValueError(f"archive path contains NUL byte: {path}")
     
     # Note: We allow .mops paths for metadata in archives
 
+# Canonical permissions keyed by (tar type, owner execute bit): directories
+# are rwxr-xr-x, regular files rw-r--r-- unless executable (rwxr-xr-x)
+_CANONICAL_MODES = {
+    (tarfile.DIRTYPE, False): 0o755,
+    (tarfile.DIRTYPE, True): 0o755,
+    **{(t, False): 0o644 for t in tarfile.REGULAR_TYPES},
+    **{(t, True): 0o755 for t in tarfile.REGULAR_TYPES},
+}
+
 def _apply_canonical_headers(tarinfo: tarfile.TarInfo) -> None:
     """
     Apply canonical tar headers for deterministic output.
@@ -263,14 +515,10 @@ def _apply_canonical_headers(tarinfo: tarfile.TarInfo) -> None:
     # Deterministic timestamp 
     tarinfo.mtime = 0
     
-    # Normalize permissions while preserving file type
-    if tarinfo.isdir():
-        tarinfo.mode = 0o755  # rwxr-xr-x for directories
-    elif tarinfo.isreg():
-        # Preserve execute bit for regular files
-        if tarinfo.mode & 0o100:
-            tarinfo.mode = 0o755  # rwxr-xr-x for executables
-        else:
-            tarinfo.mode = 0o644  # rw-r--r-- for regular files
+    # Normalize permissions while preserving file type; one table lookup on
+    # (type, owner execute bit) instead of a per-entry if/elif chain.
     # For other types (symlinks, etc.), keep existing permissions
+    tarinfo.mode = _CANONICAL_MODES.get(
+        (tarinfo.type, bool(tarinfo.mode & 0o100)), tarinfo.mode
+    )
 
@@ -0,0 +1,28 @@
+"""
+Display formatting utilities for ModelOps Bundles.
+
+Shared by the CLI printers, the storage planner, and the publisher so sizes
+read the same in every summary and error message.
+"""
+from __future__ import annotations
+
+__all__ = ["format_bytes"]
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB")
+
+
+def format_bytes(size_bytes: int) -> str:
+    """
+    Format byte count as human-readable string.
+
+    Args:
+        size_bytes: Size in bytes
+
+    Returns:
+        Formatted string (e.g., "1.5 MB", "42 KB")
+    """
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
+    # Each unit step is 10 bits; GB is the largest unit
+    idx = min((size_bytes.bit_length() - 1) // 10, 3)
+    return f"{size_bytes / (1 << (10 * idx)):.1f} {_BYTE_UNITS[idx]}"
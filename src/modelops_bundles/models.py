@@ -6,13 +6,77 @@ publishing workflow, from parsing modelops.yaml to creating OCI manifests.
 """
 from __future__ import annotations
 
+import fnmatch
 import hashlib
 import json
+import os
+import re
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator, computed_field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator, computed_field
+
+# Optional faster serializer for canonical JSON (resolved once, not per call)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _canonical_json(data) -> bytes:
+    """
+    Serialize data as canonical JSON for digest computation.
+    
+    Canonical form is json.dumps with sorted keys, compact separators and
+    ensure_ascii=True, encoded as UTF-8. orjson is used when installed; its
+    output is byte-identical whenever it contains only ASCII below DEL, since
+    json.dumps escapes DEL and everything above it. Any other document goes
+    through json.dumps so digests never depend on which serializer ran.
+    The digested models hold only strings, integers, booleans and nulls, so
+    float formatting differences between the two never come into play.
+    
+    Args:
+        data: JSON-compatible data (e.g. from model_dump)
+        
+    Returns:
+        Canonical JSON bytes
+    """
+    if orjson is not None:
+        try:
+            canonical = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            # e.g. integers beyond 64 bits; json.dumps handles these
+            canonical = None
+        if canonical is not None and canonical.isascii() and b"\x7f" not in canonical:
+            return canonical
+    
+    return json.dumps(
+        data,
+        sort_keys=True,
+        separators=(',', ':'),
+        ensure_ascii=True
+    ).encode('utf-8')
+
+
+class _CachedFieldsModel(BaseModel):
+    """
+    Frozen model whose computed fields are cached_property values.
+    
+    Freezing blocks attribute assignment, but model_copy() copies the
+    instance __dict__, cached values included. Copies made with update=
+    therefore drop the cached values and recompute them from their own
+    fields.
+    """
+    model_config = ConfigDict(frozen=True)
+    
+    def model_copy(self, *, update: Optional[dict] = None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in type(self).model_computed_fields:
+                copied.__dict__.pop(name, None)
+        return copied
 
 
 class StorageTier(str, Enum):
@@ -29,19 +93,21 @@ class ExternalRule(BaseModel):
     tier: StorageTier = Field(default=StorageTier.HOT, description="Storage access tier")
     size_threshold: Optional[int] = Field(default=None, description="Minimum file size in bytes")
     
+    # Compiled form of pattern, built once per rule
+    _pattern_re: re.Pattern = PrivateAttr()
+    
+    def model_post_init(self, __context) -> None:
+        """Compile the glob pattern once, with fnmatch's translation rules."""
+        self._pattern_re = re.compile(fnmatch.translate(os.path.normcase(self.pattern)))
+    
     def matches(self, path: str, size: int) -> bool:
         """Check if this rule matches the given file."""
-        from fnmatch import fnmatch
-        
-        # Check pattern match
-        if not fnmatch(path, self.pattern):
-            return False
-        
-        # Check size threshold if specified
+        # Check size threshold if specified (cheaper than the pattern test)
         if self.size_threshold is not None and size < self.size_threshold:
             return False
         
-        return True
+        # Check pattern match; same result as fnmatch(path, self.pattern)
+        return self._pattern_re.match(os.path.normcase(path)) is not None
     
     def format_uri(self, path: str) -> str:
         """Format URI for the given path."""
@@ -98,12 +164,18 @@ class BundleSpec(BaseModel):
     def from_yaml_file(cls, path: Path) -> BundleSpec:
         """Load BundleSpec from modelops.yaml file."""
         import yaml
+        # Prefer the LibYAML-backed loader; same safe semantics, parsed in C
+        try:
+            from yaml import CSafeLoader as Loader
+        except ImportError:
+            from yaml import SafeLoader as Loader
         
         if not path.exists():
             raise FileNotFoundError(f"Bundle specification not found: {path}")
         
-        with open(path, 'r') as f:
-            data = yaml.safe_load(f)
+        # Bytes in: the loader detects the encoding (UTF-8/UTF-16 with BOM) itself
+        with open(path, 'rb') as f:
+            data = yaml.load(f, Loader=Loader)
         
         # Handle nested spec structure
         if "spec" in data:
@@ -147,22 +219,29 @@ class LayerIndexEntry(BaseModel):
     oras: Optional[OrasDescriptor] = Field(default=None, description="ORAS blob reference")
     external: Optional[ExternalDescriptor] = Field(default=None, description="External storage reference")
     
-    @field_validator("external")
-    @classmethod
-    def validate_exactly_one_storage(cls, v, info):
+    @model_validator(mode="after")
+    def validate_exactly_one_storage(self) -> LayerIndexEntry:
         """Ensure exactly one of oras or external is specified."""
-        oras = info.data.get("oras") if info.data else None
-        
-        if v is None and oras is None:
+        if self.external is None and self.oras is None:
             raise ValueError("Entry must specify either 'oras' or 'external' storage")
         
-        if v is not None and oras is not None:
+        if self.external is not None and self.oras is not None:
             raise ValueError("Entry cannot specify both 'oras' and 'external' storage")
         
-        return v
+        return self
+    
+    def _canonical_dict(self) -> dict:
+        """Same data as model_dump(exclude_none=True), read from attributes directly."""
+        data = {"path": self.path, "layer": self.layer}
+        if self.oras is not None:
+            data["oras"] = {"digest": self.oras.digest, "size": self.oras.size}
+        if self.external is not None:
+            ext = self.external
+            data["external"] = {"uri": ext.uri, "sha256": ext.sha256, "size": ext.size, "tier": ext.tier}
+        return data
 
 
-class LayerIndex(BaseModel):
+class LayerIndex(_CachedFieldsModel):
     """Layer index document - manifest of files in a layer."""
     media_type: str = Field(
         default="application/json",
@@ -172,30 +251,45 @@ class LayerIndex(BaseModel):
     layer: str = Field(..., description="Layer name")
     entries: List[LayerIndexEntry] = Field(..., description="File entries in this layer")
     
+    @field_validator("entries")
+    @classmethod
+    def sort_entries(cls, v):
+        """Keep entries sorted by path, the order the digest is computed in."""
+        return sorted(v, key=lambda e: e.path)
+    
     @computed_field
-    @property
+    @cached_property
     def digest(self) -> str:
         """Compute deterministic digest of this layer index."""
-        # Create canonical JSON representation - exclude computed fields!
-        data = self.model_dump(by_alias=True, exclude_none=True, exclude={"digest"})
+        # Canonical JSON representation (aliased keys, no computed fields),
+        # built from the attributes directly instead of through model_dump;
+        # entries are converted one at a time below
+        data = {"mediaType": self.media_type, "layer": self.layer, "entries": None}
         
-        # Sort entries by path for determinism
-        data["entries"] = sorted(data["entries"], key=lambda e: e["path"])
+        # Hash the canonical JSON (sorted keys, no whitespace) piece by piece,
+        # one entry at a time, so the full document is never built in memory.
+        # The bytes fed in are exactly those of _canonical_json(data)
+        h = hashlib.sha256()
+        sep = b"{"
+        for key in sorted(data):
+            h.update(sep + _canonical_json(key) + b":")
+            sep = b","
+            if key == "entries":
+                h.update(b"[")
+                # Already sorted by path at validation
+                for i, entry in enumerate(self.entries):
+                    if i:
+                        h.update(b",")
+                    h.update(_canonical_json(entry._canonical_dict()))
+                h.update(b"]")
+            else:
+                h.update(_canonical_json(data[key]))
+        h.update(b"}")
         
-        # Create canonical JSON (sorted keys, no whitespace)
-        canonical = json.dumps(
-            data,
-            sort_keys=True,
-            separators=(',', ':'),
-            ensure_ascii=True
-        )
-        
-        # Compute SHA256
-        hash_bytes = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
-        return f"sha256:{hash_bytes}"
+        return f"sha256:{h.hexdigest()}"
 
 
-class BundleManifest(BaseModel):
+class BundleManifest(_CachedFieldsModel):
     """Top-level bundle manifest document."""
     media_type: str = Field(
         default="application/json",
@@ -214,22 +308,27 @@ class BundleManifest(BaseModel):
     external_index_present: bool = Field(default=True, description="Whether external references exist")
     
     @computed_field
-    @property
+    @cached_property
     def digest(self) -> str:
         """Compute deterministic digest of this bundle manifest."""
-        # Create canonical JSON representation - exclude computed fields!
-        data = self.model_dump(by_alias=True, exclude_none=True, exclude={"digest"})
+        # Canonical JSON representation (aliased keys, None dropped, no
+        # computed fields), built from the attributes instead of model_dump
+        data = {
+            "mediaType": self.media_type,
+            "name": self.name,
+            "version": self.version,
+            "roles": self.roles,
+            "layers": self.layers,
+            "external_index_present": self.external_index_present,
+        }
+        if self.description is not None:
+            data["description"] = self.description
         
         # Create canonical JSON (sorted keys, no whitespace)
-        canonical = json.dumps(
-            data,
-            sort_keys=True,
-            separators=(',', ':'),
-            ensure_ascii=True
-        )
+        canonical = _canonical_json(data)
         
         # Compute SHA256
-        hash_bytes = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+        hash_bytes = hashlib.sha256(canonical).hexdigest()
         return f"sha256:{hash_bytes}"
 
 
@@ -240,6 +339,36 @@ class FileEntry(BaseModel):
     size: int = Field(..., description="File size in bytes")
     sha256: str = Field(..., description="File SHA256 hash")
     layer: str = Field(..., description="Layer this file belongs to")
+    
+    @classmethod
+    def from_path(cls, src_path: Path, artifact_path: str, layer: str) -> FileEntry:
+        """
+        Build a FileEntry by hashing and sizing a file on disk.
+        
+        Hashes with hashlib.file_digest, which streams the file through the
+        C hash implementation without holding the contents in memory.
+        
+        Args:
+            src_path: Source file path
+            artifact_path: Path in the artifact
+            layer: Layer this file belongs to
+            
+        Returns:
+            FileEntry with size and SHA256 of the file contents
+            
+        Raises:
+            OSError: If the file cannot be read
+        """
+        with open(src_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            sha256 = hashlib.file_digest(f, "sha256").hexdigest()
+        return cls(
+            src_path=src_path,
+            artifact_path=artifact_path,
+            size=size,
+            sha256=sha256,
+            layer=layer
+        )
 
 
 class StorageDecision(str, Enum):
@@ -248,23 +377,25 @@ class StorageDecision(str, Enum):
     EXTERNAL = "external"
 
 
-class LayerPlan(BaseModel):
+class LayerPlan(_CachedFieldsModel):
     """Storage plan for a single layer."""
     name: str = Field(..., description="Layer name")
     files: List[FileEntry] = Field(..., description="Files in this layer")
     storage_decisions: Dict[str, StorageDecision] = Field(..., description="Path to storage decision")
     
     @computed_field
-    @property
+    @cached_property
     def oras_files(self) -> List[FileEntry]:
         """Files that will be stored in ORAS."""
-        return [f for f in self.files if self.storage_decisions[f.artifact_path] == StorageDecision.ORAS]
+        decisions = self.storage_decisions
+        return [f for f in self.files if decisions[f.artifact_path] is StorageDecision.ORAS]
     
     @computed_field 
-    @property
+    @cached_property
     def external_files(self) -> List[FileEntry]:
         """Files that will be stored externally."""
-        return [f for f in self.files if self.storage_decisions[f.artifact_path] == StorageDecision.EXTERNAL]
+        decisions = self.storage_decisions
+        return [f for f in self.files if decisions[f.artifact_path] is StorageDecision.EXTERNAL]
 
 
 class StoragePlan(BaseModel):
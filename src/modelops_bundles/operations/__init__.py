@@ -5,7 +5,33 @@ This package provides the Operations facade that orchestrates CLI commands,
 centralizes error mapping, and handles output formatting while keeping
 CLI commands thin and testable.
 """
-from .facade import Operations, OpsConfig
-from .mappers import exit_code_for, run_and_exit
+from __future__ import annotations
 
-__all__ = ["Operations", "OpsConfig", "exit_code_for", "run_and_exit"]
\ No newline at end of file
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .facade import Operations, OpsConfig
+    from .mappers import exit_code_for, run_and_exit
+
+__all__ = ["Operations", "OpsConfig", "exit_code_for", "run_and_exit"]
+
+# Public name -> submodule. Resolved on first access so that importing only
+# the error mappers (e.g. for export) does not load the facade, the runtime,
+# and the ORAS registry client.
+_LAZY_ATTRS = {
+    "Operations": ".facade",
+    "OpsConfig": ".facade",
+    "exit_code_for": ".mappers",
+    "run_and_exit": ".mappers",
+}
+
+
+def __getattr__(name: str):
+    """Resolve public names from their submodule on first access (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
\ No newline at end of file
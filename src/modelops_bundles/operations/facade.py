@@ -7,14 +7,23 @@ CLI commands thin and testable.
 """
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 from modelops_contracts.artifacts import BundleRef, ResolvedBundle
 
 from ..runtime import resolve as _resolve, materialize as _materialize, MaterializeResult
 from ..runtime_types import ContentProvider
-from ..storage.oras_bundle_registry import OrasBundleRegistry
 
+if TYPE_CHECKING:
+    # Imported on demand: pulls in the oras client and its HTTP/TLS stack
+    from ..storage.oras_bundle_registry import OrasBundleRegistry
+
+
+# major.minor.patch with an optional "v" prefix (repeated v's are tolerated,
+# as the previous lstrip("v") parsing did)
+_SEMVER_RE = re.compile(r"(v*)(\d+)\.(\d+)\.(\d+)")
 
 def _apply_version_bump(current_version: str, bump: str) -> str:
     """
@@ -31,38 +40,33 @@ def _apply_version_bump(current_version: str, bump: str) -> str:
         ValueError: If version format is invalid or bump strategy is unknown
     """
     # Simple semver parsing - handle "v" prefix
-    version = current_version.lstrip("v")
+    m = _SEMVER_RE.fullmatch(current_version)
+    if m is None:
+        raise ValueError(
+            f"Invalid version format '{current_version}': "
+            "Version must be in format 'major.minor.patch'"
+        )
+    prefix, major, minor, patch = m.group(1), int(m.group(2)), int(m.group(3)), int(m.group(4))
     
-    try:
-        parts = version.split(".")
-        if len(parts) != 3:
-            raise ValueError("Version must be in format 'major.minor.patch'")
-        
-        major, minor, patch = int(parts[0]), int(parts[1]), int(parts[2])
-        
-        if bump == "patch":
-            patch += 1
-        elif bump == "minor":
-            minor += 1
-            patch = 0
-        elif bump == "major":
-            major += 1
-            minor = 0
-            patch = 0
-        else:
-            raise ValueError(f"Unknown bump strategy: {bump}. Use 'patch', 'minor', or 'major'")
-        
-        # Preserve "v" prefix if it was present
-        new_version = f"{major}.{minor}.{patch}"
-        if current_version.startswith("v"):
-            new_version = f"v{new_version}"
-        
-        return new_version
-        
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid version format '{current_version}': {e}") from e
+    if bump == "patch":
+        patch += 1
+    elif bump == "minor":
+        minor += 1
+        patch = 0
+    elif bump == "major":
+        major += 1
+        minor = 0
+        patch = 0
+    else:
+        raise ValueError(
+            f"Invalid version format '{current_version}': "
+            f"Unknown bump strategy: {bump}. Use 'patch', 'minor', or 'major'"
+        )
+    
+    # Preserve "v" prefix if it was present
+    return f"{'v' if prefix else ''}{major}.{minor}.{patch}"
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpsConfig:
     """
     Configuration for Operations facade.
@@ -72,9 +76,10 @@ class OpsConfig:
     """
     ci: bool = False              # Running in CI environment
     cache: bool = True            # Enable bundle caching
-    zstd_level: int = 19          # Fixed compression level for determinism
+    zstd_level: int = 15          # Fixed compression level for determinism
     human: bool = True            # Human text output (JSON mode in future)
     verbose: bool = False         # Show detailed output
+    concurrency: int = 1          # Parallel blob fetches in materialize (opt-in)
 
 class Operations:
     """
@@ -118,9 +123,13 @@ class Operations:
         
         # Create registry if not provided
         if registry is None:
+            from ..storage.oras_bundle_registry import OrasBundleRegistry
             self.registry = OrasBundleRegistry(settings)
         else:
             self.registry = registry
+        
+        # Resolutions of digest-pinned refs, keyed by (name, digest)
+        self._resolved: Dict[Tuple[str, str], ResolvedBundle] = {}
 
     def resolve(self, ref: BundleRef) -> ResolvedBundle:
         """
@@ -132,7 +141,21 @@ class Operations:
         Returns:
             Resolved bundle with manifest digest and metadata
         """
-        return _resolve(ref, registry=self.registry, settings=self.settings, cache=self.cfg.cache)
+        # A digest-pinned ref always names the same bundle, so with caching
+        # enabled it is resolved once per facade; tag refs can move and
+        # always go to the registry
+        key = (ref.name, ref.digest) if self.cfg.cache and ref.name and ref.digest else None
+        if key is not None and key in self._resolved:
+            return self._resolved[key]
+        
+        resolved = _resolve(ref, registry=self.registry, settings=self.settings, cache=self.cfg.cache)
+        if key is not None:
+            self._resolved[key] = resolved
+        return resolved
+
+    def clear_cache(self) -> None:
+        """Forget resolutions memoized by resolve()."""
+        self._resolved.clear()
 
     def materialize(self, ref: BundleRef, dest: str, *,
                     role: Optional[str] = None,
@@ -165,7 +188,8 @@ class Operations:
             prefetch_external=prefetch_external,
             provider=self.provider,
             registry=self.registry,
-            settings=self.settings
+            settings=self.settings,
+            concurrency=self.cfg.concurrency
         )
 
     def pull(self, ref: BundleRef, dest: str, *,
@@ -278,16 +302,16 @@ class Operations:
         """
         # Handle version bumping if requested
         if bump:
-            from pathlib import Path
             from ..planner import scan_directory
             
+            wd = Path(working_dir)
             # Load current spec to get version
-            spec = scan_directory(Path(working_dir))
+            spec = scan_directory(wd)
             current_version = spec.version
             new_version = _apply_version_bump(current_version, bump)
             
             # Update version in spec file
-            _update_version_in_spec(Path(working_dir), new_version)
+            _update_version_in_spec(wd, new_version)
             print(f"🔄 Version bumped: {current_version} -> {new_version}")
         
         # Delegate to publisher
@@ -302,37 +326,135 @@ class Operations:
         )
 
 
-def _update_version_in_spec(working_dir: "Path", new_version: str) -> None:
+def _update_version_in_spec(working_dir: Path, new_version: str) -> None:
     """
     Update version in modelops.yaml file.
     
+    The metadata version line is rewritten in place when it can be located
+    unambiguously, which keeps comments and formatting intact. Otherwise the
+    spec is loaded, updated, and dumped with PyYAML.
+    
     Args:
         working_dir: Directory containing modelops.yaml
         new_version: New version to set
     """
-    import yaml
+    from ..planner import find_spec_file
     
-    # Find spec file
-    spec_files = ["modelops.yaml", "modelops.yml", ".mops-bundle.yaml", ".mops-bundle.yml"]
-    spec_path = None
+    spec_path = find_spec_file(working_dir)
+    if spec_path is None:
+        raise FileNotFoundError("No bundle specification file found")
     
-    for filename in spec_files:
-        candidate = working_dir / filename
-        if candidate.exists():
-            spec_path = candidate
-            break
+    # newline='' keeps the file's own line endings through the rewrite
+    with open(spec_path, 'r', newline='') as f:
+        text = f.read()
     
-    if not spec_path:
-        raise FileNotFoundError("No bundle specification file found")
+    updated = _rewrite_spec_version(text, new_version)
+    if updated is not None:
+        # newline='' again: the rewritten text already has the file's endings
+        _replace_spec_file(spec_path, updated, newline='')
+        return
+    
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeLoader as Loader, SafeDumper as Dumper
     
     # Load, update, and save
-    with open(spec_path, 'r') as f:
-        data = yaml.safe_load(f)
+    data = yaml.load(text, Loader=Loader)
     
     # Update version in metadata
     if "metadata" not in data:
         data["metadata"] = {}
     data["metadata"]["version"] = new_version
     
-    with open(spec_path, 'w') as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
\ No newline at end of file
+    _replace_spec_file(
+        spec_path, yaml.dump(data, Dumper=Dumper, default_flow_style=False, sort_keys=False)
+    )
+
+
+def _replace_spec_file(spec_path: Path, text: str, newline: Optional[str] = None) -> None:
+    """
+    Atomically replace a spec file's contents.
+    
+    Writes to a temp file in the same directory, fsyncs it, and renames it
+    over spec_path, so an interrupted push never leaves a truncated spec.
+    
+    Args:
+        spec_path: Spec file to replace
+        text: New file contents
+        newline: Newline translation for the write (as for open())
+    """
+    import os
+    
+    temp_path = spec_path.parent / f"{spec_path.name}.tmp.{os.getpid()}"
+    try:
+        with open(temp_path, 'w', newline=newline) as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, spec_path)
+    except Exception:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise
+
+
+# Versions that YAML reads back as the same plain string (x.y.z, optional v)
+_PLAIN_VERSION_RE = re.compile(r"v?\d+\.\d+\.\d+")
+# Block-style "metadata:" key at column 0, optionally commented
+_METADATA_KEY_RE = re.compile(r"metadata:[ \t]*(?:#.*)?")
+# Value after "version:": a single-line quoted or plain scalar, then an
+# optional comment; anchors, tags, and block or flow values do not match
+_VERSION_VALUE_RE = re.compile(
+    r"[ \t]+(?:\"[^\"\n]*\"|'[^'\n]*'|[^\s#'\"&*!|>{\[][^#\n]*?)(?P<rest>[ \t]+#.*|[ \t]*)"
+)
+
+def _rewrite_spec_version(text: str, new_version: str) -> Optional[str]:
+    """
+    Replace the value of metadata.version in spec text, line-wise.
+    
+    Args:
+        text: Spec file contents
+        new_version: New version to set
+        
+    Returns:
+        Updated text, or None if the version line cannot be rewritten safely
+        (no block-style metadata.version, or a value that is not a simple
+        single-line scalar) and the spec must go through a YAML round-trip
+    """
+    if not _PLAIN_VERSION_RE.fullmatch(new_version):
+        return None
+    
+    lines = text.splitlines(keepends=True)
+    in_metadata = False
+    child_indent = None
+    for i, line in enumerate(lines):
+        body = line.rstrip("\r\n")
+        stripped = body.lstrip(" ")
+        if not stripped or stripped.startswith("#"):
+            continue
+        indent = len(body) - len(stripped)
+        
+        if indent == 0:
+            if in_metadata:
+                # Left the metadata block without finding its version
+                return None
+            in_metadata = _METADATA_KEY_RE.fullmatch(body) is not None
+            continue
+        if not in_metadata:
+            continue
+        
+        # Only direct children of metadata, not keys nested deeper
+        if child_indent is None:
+            child_indent = indent
+        if indent != child_indent or not stripped.startswith("version:"):
+            continue
+        
+        m = _VERSION_VALUE_RE.fullmatch(stripped, len("version:"))
+        if m is None:
+            return None
+        lines[i] = f"{body[:indent]}version: {new_version}{m.group('rest')}{line[len(body):]}"
+        return "".join(lines)
+    
+    return None
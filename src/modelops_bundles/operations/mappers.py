@@ -34,13 +34,21 @@ def exit_code_for(exc: BaseException) -> int:
     - 11: Role/layer mismatch (RoleLayerMismatch)
     - 12: Workdir conflict (WorkdirConflict)
     
+    Subclasses map like their nearest mapped base class (e.g. a
+    ``json.JSONDecodeError`` is a ``ValueError``). Classes are matched by
+    name so this module need not import the runtime and its dependencies.
+    
     Args:
         exc: Exception to map
         
     Returns:
         Exit code (1-12, with 3 as fallback for unknown exceptions)
     """
-    return EXIT_CODES.get(type(exc).__name__, 3)
+    for cls in type(exc).__mro__:
+        code = EXIT_CODES.get(cls.__name__)
+        if code is not None:
+            return code
+    return 3
 
 def run_and_exit(func: Callable[[], T]) -> T:
     """
@@ -62,8 +70,9 @@ def run_and_exit(func: Callable[[], T]) -> T:
     try:
         return func()
     except Exception as e:
-        # Special handling for WorkdirConflict to show conflict details
-        if type(e).__name__ == "WorkdirConflict" and hasattr(e, 'conflicts'):
+        code = exit_code_for(e)
+        # Special handling for WorkdirConflict (exit 12) to show conflict details
+        if code == EXIT_CODES["WorkdirConflict"] and hasattr(e, 'conflicts'):
             from .printers import print_conflicts
             print_conflicts(e.conflicts)
-        raise typer.Exit(code=exit_code_for(e)) from e
\ No newline at end of file
+        raise typer.Exit(code=code) from e
\ No newline at end of file
@@ -7,8 +7,12 @@ in future stages while keeping CLI commands thin and focused.
 from __future__ import annotations
 
 import typer
-from typing import List, Optional
-from modelops_contracts.artifacts import ResolvedBundle
+from typing import TYPE_CHECKING, List, Optional
+
+from ..formatting import format_bytes
+
+if TYPE_CHECKING:
+    from modelops_contracts.artifacts import ResolvedBundle
 
 # Optional Rich support for enhanced output
 try:
@@ -17,10 +21,28 @@ try:
     from rich.text import Text
     _RICH = True
     _console = Console()
+    # Field labels, built once rather than parsed from markup on every print
+    _BUNDLE_LABEL = Text("Bundle:", style="bold")
+    _MANIFEST_LABEL = Text("Manifest:", style="bold")
+    _SIZE_LABEL = Text("Size:", style="bold")
+    _REF_TYPE_LABEL = Text("Reference type:", style="bold")
+    _EXTERNAL_INDEX_LABEL = Text("External index:", style="bold")
+    _NO_ROLES = Text("No roles defined", style="dim")
 except ImportError:
     _RICH = False
     _console = None
 
+def _bundle_label(bundle: ResolvedBundle) -> str:
+    """Format a bundle label defensively: name:version, else a short digest."""
+    if bundle.ref.name and bundle.ref.version:
+        return f"{bundle.ref.name}:{bundle.ref.version}"
+    return bundle.manifest_digest[:18] + "…"
+
+def _field(label: Text, value: str, style: str = "") -> Text:
+    """Join a prebuilt label and a (literal, unparsed) value into one line."""
+    # Highlight as Console.print does for plain strings, so output is unchanged
+    return _console.highlighter(Text.assemble(label, " ", (value, style)))
+
 def print_resolved_bundle(bundle: ResolvedBundle, verbose: bool = False) -> None:
     """
     Print resolved bundle information in human-readable format.
@@ -31,55 +53,53 @@ def print_resolved_bundle(bundle: ResolvedBundle, verbose: bool = False) -> None
         bundle: Resolved bundle to display
         verbose: Show detailed information including media type decisions
     """
-    # Format bundle label defensively
-    label = (
-        f"{bundle.ref.name}:{bundle.ref.version}"
-        if bundle.ref.name and bundle.ref.version
-        else bundle.manifest_digest[:18] + "…"
-    )
+    label = _bundle_label(bundle)
     
     if _RICH:
-        _console.print(f"[bold]Bundle:[/] {label}")
-        _console.print(f"[bold]Manifest:[/] [dim]{bundle.manifest_digest}[/]")
-        _console.print(f"[bold]Size:[/] {_format_bytes(bundle.total_size)}")
-        
-        if verbose:
-            _console.print(f"[bold]Reference type:[/] {'digest-only' if bundle.ref.digest else 'name:version'}")
-            if bundle.external_index_present:
-                _console.print("[bold]External index:[/] present")
-            else:
-                _console.print("[bold]External index:[/] not present")
-        
-        if bundle.roles:
-            table = Table(title="Roles")
-            table.add_column("Role", style="cyan")
-            table.add_column("Layers", style="yellow")
+        # Buffer the whole block and write it out once on exit
+        with _console:
+            _console.print(_field(_BUNDLE_LABEL, label))
+            _console.print(_field(_MANIFEST_LABEL, bundle.manifest_digest, "dim"))
+            _console.print(_field(_SIZE_LABEL, format_bytes(bundle.total_size)))
             
-            for role_name, layers in sorted(bundle.roles.items()):
-                layer_list = ", ".join(layers)
-                table.add_row(role_name, layer_list)
+            if verbose:
+                _console.print(_field(_REF_TYPE_LABEL, 'digest-only' if bundle.ref.digest else 'name:version'))
+                _console.print(_field(_EXTERNAL_INDEX_LABEL, 'present' if bundle.external_index_present else 'not present'))
             
-            _console.print(table)
-        else:
-            _console.print("[dim]No roles defined[/]")
+            if bundle.roles:
+                table = Table(title="Roles")
+                table.add_column("Role", style="cyan")
+                table.add_column("Layers", style="yellow")
+                
+                for role_name, layers in sorted(bundle.roles.items()):
+                    layer_list = ", ".join(layers)
+                    table.add_row(role_name, layer_list)
+                
+                _console.print(table)
+            else:
+                _console.print(_NO_ROLES)
         return
     
-    # Fallback to plain text
-    typer.echo(f"Manifest: {bundle.manifest_digest}")
-    typer.echo(f"Bundle: {label}")
-    typer.echo(f"Size: {_format_bytes(bundle.total_size)}")
+    # Fallback to plain text, collected and echoed in one write
+    lines = [
+        f"Manifest: {bundle.manifest_digest}",
+        f"Bundle: {label}",
+        f"Size: {format_bytes(bundle.total_size)}",
+    ]
     
     if verbose:
-        typer.echo(f"Reference type: {'digest-only' if bundle.ref.digest else 'name:version'}")
-        typer.echo(f"External index: {'present' if bundle.external_index_present else 'not present'}")
+        lines.append(f"Reference type: {'digest-only' if bundle.ref.digest else 'name:version'}")
+        lines.append(f"External index: {'present' if bundle.external_index_present else 'not present'}")
     
     if bundle.roles:
-        typer.echo("Roles:")
+        lines.append("Roles:")
         for role_name, layers in sorted(bundle.roles.items()):
             layer_list = ", ".join(layers)
-            typer.echo(f"  {role_name}: [{layer_list}]")
+            lines.append(f"  {role_name}: [{layer_list}]")
     else:
-        typer.echo("No roles defined")
+        lines.append("No roles defined")
+    
+    typer.echo("\n".join(lines))
 
 def print_materialize_summary(bundle: ResolvedBundle, dest: str, role: str) -> None:
     """
@@ -90,22 +110,18 @@ def print_materialize_summary(bundle: ResolvedBundle, dest: str, role: str) -> N
         dest: Destination directory
         role: Role that was materialized
     """
-    # Format bundle label defensively
-    label = (
-        f"{bundle.ref.name}:{bundle.ref.version}"
-        if bundle.ref.name and bundle.ref.version
-        else bundle.manifest_digest[:18] + "…"
-    )
+    label = _bundle_label(bundle)
     
-    typer.echo(f"Materialized {label} to {dest}")
-    typer.echo(f"Role: {role}")
+    lines = [f"Materialized {label} to {dest}", f"Role: {role}"]
     
     layers = bundle.roles.get(role)
     if layers:
-        typer.echo(f"Layers: {', '.join(layers)}")
+        lines.append(f"Layers: {', '.join(layers)}")
     else:
         # Extremely defensive; runtime already validates role
-        typer.echo(f"Role '{role}' not found in bundle")
+        lines.append(f"Role '{role}' not found in bundle")
+    
+    typer.echo("\n".join(lines))
 
 def print_export_summary(src_dir: str, out_path: str, include_external: bool) -> None:
     """
@@ -134,6 +150,17 @@ def print_materialize_progress(path: str, action: str, ci_mode: bool = False) ->
     if not ci_mode:
         typer.echo(f"{action}: {path}")
 
+def _conflict_detail(conflict: dict) -> str:
+    """Describe a conflict for the Detail column of the conflicts table."""
+    expected = conflict.get("expected_sha256")
+    actual = conflict.get("actual_sha256")
+    if expected is not None and actual is not None:
+        return f"expected {expected[:8]}..., got {actual[:8]}..."
+    if "error" in conflict:
+        return conflict["error"]
+    return "conflict"
+
+
 def print_conflicts(conflicts: List[dict], max_display: int = 5) -> None:
     """
     Print workdir conflicts in human-readable format.
@@ -147,37 +174,32 @@ def print_conflicts(conflicts: List[dict], max_display: int = 5) -> None:
         table.add_column("Path", style="red")
         table.add_column("Detail", style="yellow")
         
-        for conflict in conflicts[:max_display]:
-            path = conflict.get("path", "unknown")
-            if "expected_sha256" in conflict and "actual_sha256" in conflict:
-                expected = conflict["expected_sha256"][:8]
-                actual = conflict["actual_sha256"][:8]
-                detail = f"expected {expected}..., got {actual}..."
-            elif "error" in conflict:
-                detail = conflict["error"]
-            else:
-                detail = "conflict"
-            table.add_row(path, detail)
+        rows = [(c.get("path", "unknown"), _conflict_detail(c)) for c in conflicts[:max_display]]
+        for row in rows:
+            table.add_row(*row)
         
-        _console.print(table)
-        if len(conflicts) > max_display:
-            _console.print(f"[dim]… and {len(conflicts) - max_display} more[/]")
+        with _console:
+            _console.print(table)
+            if len(conflicts) > max_display:
+                _console.print(f"[dim]… and {len(conflicts) - max_display} more[/]")
         return
     
-    # Fallback to plain text
-    typer.echo(f"Found {len(conflicts)} conflicts:")
+    # Fallback to plain text, collected and echoed in one write
+    lines = [f"Found {len(conflicts)} conflicts:"]
     
-    for i, conflict in enumerate(conflicts[:max_display]):
+    for conflict in conflicts[:max_display]:
         path = conflict.get("path", "unknown")
         if "expected_sha256" in conflict and "actual_sha256" in conflict:
-            typer.echo(f"  {path}: content mismatch")
+            lines.append(f"  {path}: content mismatch")
         elif "error" in conflict:
-            typer.echo(f"  {path}: {conflict['error']}")
+            lines.append(f"  {path}: {conflict['error']}")
         else:
-            typer.echo(f"  {path}: conflict")
+            lines.append(f"  {path}: conflict")
     
     if len(conflicts) > max_display:
-        typer.echo(f"  ... and {len(conflicts) - max_display} more")
+        lines.append(f"  ... and {len(conflicts) - max_display} more")
+    
+    typer.echo("\n".join(lines))
 
 def print_push_summary(digest: str, working_dir: str, bump: Optional[str] = None) -> None:
     """
@@ -210,24 +232,3 @@ def print_stub_message(command: str) -> None:
     """
     typer.echo(f"[{command}] Command implemented as stub")
     typer.echo("Full implementation coming soon")
-
-def _format_bytes(size_bytes: int) -> str:
-    """
-    Format byte count as human-readable string.
-    
-    Args:
-        size_bytes: Size in bytes
-        
-    Returns:
-        Formatted string (e.g., "1.5 MB", "42 KB")
-    """
-    if size_bytes == 0:
-        return "0 B"
-    elif size_bytes < 1024:
-        return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
\ No newline at end of file
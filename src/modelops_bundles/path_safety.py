@@ -8,6 +8,8 @@ from __future__ import annotations
 
 from pathlib import PurePosixPath
 
+__all__ = ["safe_relpath"]
+
 
 def safe_relpath(path: str) -> str:
     """
@@ -47,12 +49,18 @@ def safe_relpath(path: str) -> str:
         >>> safe_relpath(".mops/hijack.json")
         ValueError: unsafe path: .mops/hijack.json
     """
+    # Fast path: with no empty or "." components the path is already in the
+    # form PurePosixPath would normalize it to, so the same checks can run on
+    # the string and its split parts without building a path object
+    parts = path.split("/")
+    if "" not in parts and "." not in parts:
+        if "\\" in path or ".." in parts or parts[0] == ".mops":
+            raise ValueError(f"unsafe path: {path}")
+        return path
+    
     rel = PurePosixPath(path)
     s = str(rel)
-    if not s or s == ".":
-        raise ValueError(f"unsafe path: {path}")
-    if "\\" in s:
-        raise ValueError(f"unsafe path: {path}")
-    if rel.is_absolute() or ".." in rel.parts or s == ".mops" or s.startswith(".mops/"):
+    if (not s or s == "." or "\\" in s or rel.is_absolute() or ".." in rel.parts
+            or s == ".mops" or s.startswith(".mops/")):
         raise ValueError(f"unsafe path: {path}")
     return s
\ No newline at end of file
@@ -6,12 +6,13 @@ about what goes in ORAS vs external storage. Ensures deterministic behavior.
 """
 from __future__ import annotations
 
-import hashlib
 import os
-from fnmatch import fnmatch
+import re
+from fnmatch import translate
 from pathlib import Path
 from typing import Dict, List, Set
 
+from .formatting import format_bytes
 from .models import (
     BundleSpec,
     FileEntry,
@@ -27,6 +28,23 @@ from .models import (
 )
 
 
+# Bundle specification file names, in lookup order
+SPEC_FILES = ("modelops.yaml", "modelops.yml", ".mops-bundle.yaml", ".mops-bundle.yml")
+
+
+def find_spec_file(working_dir: Path) -> Path | None:
+    """
+    Locate the bundle specification file in a working directory.
+    
+    Args:
+        working_dir: Directory to search
+        
+    Returns:
+        Path of the first existing file from SPEC_FILES, or None
+    """
+    return next((p for p in (working_dir / f for f in SPEC_FILES) if p.exists()), None)
+
+
 def scan_directory(working_dir: Path) -> BundleSpec:
     """
     Scan working directory and parse bundle specification.
@@ -44,19 +62,11 @@ def scan_directory(working_dir: Path) -> BundleSpec:
     working_dir = Path(working_dir)
     
     # Look for bundle specification file
-    spec_files = ["modelops.yaml", "modelops.yml", ".mops-bundle.yaml", ".mops-bundle.yml"]
-    spec_path = None
-    
-    for filename in spec_files:
-        candidate = working_dir / filename
-        if candidate.exists():
-            spec_path = candidate
-            break
-    
+    spec_path = find_spec_file(working_dir)
     if spec_path is None:
         raise FileNotFoundError(
             f"Bundle specification not found in {working_dir}. "
-            f"Expected one of: {', '.join(spec_files)}"
+            f"Expected one of: {', '.join(SPEC_FILES)}"
         )
     
     try:
@@ -226,16 +236,8 @@ def _scan_layer_files(layer_spec, working_dir: Path) -> List[FileEntry]:
                 continue
             seen_paths.add(artifact_path)
             
-            # Compute file hash
-            sha256_hash = _compute_file_hash(abs_path)
-            
-            matched_files.append(FileEntry(
-                src_path=abs_path,
-                artifact_path=artifact_path,
-                size=abs_path.stat().st_size,
-                sha256=sha256_hash,
-                layer=layer_spec.name
-            ))
+            # Hash and size the file
+            matched_files.append(FileEntry.from_path(abs_path, artifact_path, layer_spec.name))
     
     # Sort for deterministic ordering
     return sorted(matched_files, key=lambda f: f.artifact_path)
@@ -263,37 +265,49 @@ def _glob_files(working_dir: Path, pattern: str, ignore_patterns: List[str]) ->
         # Relative pattern - join with working dir
         search_pattern = str(working_dir / pattern)
     
+    # All ignore patterns as one compiled alternation (same matching as
+    # fnmatch, including its case normalization), instead of a loop per file
+    ignore_re = _compile_ignore(ignore_patterns)
+    
     # Find all matching paths
     matches = []
     for path_str in glob.glob(search_pattern, recursive=True):
-        path = Path(path_str)
-        
-        # Only include files (not directories)
-        if not path.is_file():
+        # Only include files (not directories); test the string before
+        # building a Path for it
+        if not os.path.isfile(path_str):
             continue
+        path = Path(path_str)
         
         # Check ignore patterns
         try:
             rel_path = path.relative_to(working_dir)
-            rel_path_str = str(rel_path).replace('\\', '/')
-            
-            # Check if any ignore pattern matches
-            ignored = False
-            for ignore_pattern in ignore_patterns:
-                if fnmatch(rel_path_str, ignore_pattern):
-                    ignored = True
-                    break
-            
-            if not ignored:
-                matches.append(path)
-                
         except ValueError:
             # File is outside working directory - skip
             continue
+        
+        rel_path_str = str(rel_path).replace('\\', '/')
+        if ignore_re is None or ignore_re.match(os.path.normcase(rel_path_str)) is None:
+            matches.append(path)
     
     return matches
 
 
+def _compile_ignore(ignore_patterns: List[str]) -> re.Pattern | None:
+    """
+    Compile ignore globs into a single regex.
+    
+    Args:
+        ignore_patterns: fnmatch-style patterns
+        
+    Returns:
+        Regex matching any of the patterns (against a normcase'd path),
+        or None if there are no patterns
+    """
+    if not ignore_patterns:
+        return None
+    return re.compile("|".join(translate(os.path.normcase(p)) for p in ignore_patterns))
+
+
 def _make_storage_decisions(files: List[FileEntry], external_rules: List[ExternalRule], 
                            oras_size_limit: int) -> Dict[str, StorageDecision]:
     """
@@ -322,8 +336,8 @@ def _make_storage_decisions(files: List[FileEntry], external_rules: List[Externa
         elif file_entry.size > oras_size_limit:
             # File too large for ORAS and no external rule matches
             raise ValueError(
-                f"File {file_entry.artifact_path} ({_format_bytes(file_entry.size)}) "
-                f"exceeds ORAS limit ({_format_bytes(oras_size_limit)}) but no external "
+                f"File {file_entry.artifact_path} ({format_bytes(file_entry.size)}) "
+                f"exceeds ORAS limit ({format_bytes(oras_size_limit)}) but no external "
                 f"storage rule matches. Add an external rule for this file pattern."
             )
         else:
@@ -332,26 +346,6 @@ def _make_storage_decisions(files: List[FileEntry], external_rules: List[Externa
     return decisions
 
 
-def _compute_file_hash(file_path: Path) -> str:
-    """
-    Compute SHA256 hash of file contents.
-    
-    Args:
-        file_path: Path to file
-        
-    Returns:
-        SHA256 hash as hex string (without sha256: prefix)
-    """
-    sha256_hash = hashlib.sha256()
-    
-    with open(file_path, 'rb') as f:
-        # Read in chunks to handle large files
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256_hash.update(chunk)
-    
-    return sha256_hash.hexdigest()
-
-
 def _generate_external_uri(file_entry: FileEntry, external_rules: List[ExternalRule]) -> str:
     """
     Generate external storage URI for a file.
@@ -383,20 +377,6 @@ def _determine_storage_tier(file_entry: FileEntry, external_rules: List[External
     return StorageTier.HOT
 
 
-def _format_bytes(size_bytes: int) -> str:
-    """Format byte count as human-readable string."""
-    if size_bytes == 0:
-        return "0 B"
-    elif size_bytes < 1024:
-        return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
-
-
 # TODO: Implement "no changes" detection by comparing layer digests with remote bundle
 # This would allow skipping push if nothing has changed since last push
 def detect_changes(plan: StoragePlan, remote_manifest: BundleManifest = None) -> bool:
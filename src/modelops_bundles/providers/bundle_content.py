@@ -253,12 +253,19 @@ class BundleContentProvider(ContentProvider):
         return BytesIO(content_bytes)
 
 
-def create_provider_from_env() -> BundleContentProvider:
+def create_provider_from_env(settings: Settings | None = None,
+                             registry: OrasBundleRegistry | None = None) -> BundleContentProvider:
     """
     Create BundleContentProvider with real adapters from environment settings.
     
     This factory creates a fresh provider instance every time without caching,
-    ensuring test isolation and eliminating global state.
+    ensuring test isolation and eliminating global state. Callers that already
+    hold settings and a registry (e.g. a CLIContext) can pass them in so they
+    are shared rather than built a second time.
+    
+    Args:
+        settings: Optional settings (if None, loaded from environment)
+        registry: Optional registry (if None, created from settings)
     
     Returns:
         BundleContentProvider configured with real adapters
@@ -275,7 +282,8 @@ def create_provider_from_env() -> BundleContentProvider:
     from ..storage.oras_bundle_registry import OrasBundleRegistry
     from ..storage.object_store import AzureExternalAdapter
     
-    settings = create_settings_from_env()
+    if settings is None:
+        settings = create_settings_from_env()
     
     # Validate Azure configuration is present
     has_conn_str = bool(settings.az_connection_string)
@@ -285,7 +293,8 @@ def create_provider_from_env() -> BundleContentProvider:
         raise ValueError("Azure authentication not configured. Set either AZURE_STORAGE_CONNECTION_STRING or (AZURE_STORAGE_ACCOUNT + AZURE_STORAGE_KEY)")
     
     # Create real adapters
-    registry = OrasBundleRegistry(settings)
+    if registry is None:
+        registry = OrasBundleRegistry(settings)
     external_adapter = AzureExternalAdapter(settings=settings)
     
     return BundleContentProvider(
@@ -293,5 +302,3 @@ def create_provider_from_env() -> BundleContentProvider:
         external=external_adapter,
         settings=settings
     )
-
-
@@ -12,6 +12,7 @@ import tempfile
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from .formatting import format_bytes
 from .models import (
     BundleSpec,
     StoragePlan,
@@ -514,8 +515,8 @@ def _show_dry_run_summary(plan: StoragePlan, layer_indexes: Dict[str, LayerIndex
     external_size = sum(f.size for f in plan.all_external_files)
     
     print(f"\n📊 Storage Summary:")
-    print(f"  ORAS: {total_oras} files ({_format_bytes(oras_size)})")
-    print(f"  External: {total_external} files ({_format_bytes(external_size)})")
+    print(f"  ORAS: {total_oras} files ({format_bytes(oras_size)})")
+    print(f"  External: {total_external} files ({format_bytes(external_size)})")
     
     # Show roles
     print(f"\n🎭 Roles ({len(plan.spec.roles)}):")
@@ -559,25 +560,11 @@ def _print_push_summary(plan: StoragePlan, layer_indexes: Dict[str, LayerIndex],
     print(f"\n✅ Successfully pushed {plan.spec.name}:{plan.spec.version}")
     print(f"📋 Repository: {repo}:{tag}")
     print(f"🔗 Manifest digest: {digest}")
-    print(f"📦 ORAS files: {total_oras} ({_format_bytes(oras_size)})")
+    print(f"📦 ORAS files: {total_oras} ({format_bytes(oras_size)})")
     print(f"🔗 External refs: {total_external}")
     print(f"🏷️  Layers: {len(layer_indexes)}")
 
 
-def _format_bytes(size_bytes: int) -> str:
-    """Format byte count as human-readable string."""
-    if size_bytes == 0:
-        return "0 B"
-    elif size_bytes < 1024:
-        return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
-
-
 # TODO: Add support for multiple tags (tag + latest)
 def push_with_multiple_tags(working_dir: str | Path, repo: str, tags: List[str], **kwargs) -> Dict[str, str]:
     """
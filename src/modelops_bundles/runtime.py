@@ -11,6 +11,7 @@ import hashlib
 import json
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List
 from dataclasses import dataclass
@@ -222,6 +223,7 @@ def materialize(
     provider: ContentProvider,
     registry: 'OrasBundleRegistry' = None,
     settings = None,
+    concurrency: int = 1,
 ) -> MaterializeResult:
     """
     Mirror layers for the selected role into dest.
@@ -243,7 +245,10 @@ def materialize(
         provider: ContentProvider to enumerate entries for materialization
         registry: Optional ORAS bundle registry (defaults to OrasBundleRegistry)
         settings: Optional settings (passed to resolve())
-        
+        concurrency: Maximum number of blobs fetched at once (1 = sequential).
+            Values above 1 call the provider's fetch methods from worker
+            threads, so the provider must be safe to use concurrently
+
     Returns:
         MaterializeResult containing bundle, selected_role, and dest_path
         
@@ -278,6 +283,8 @@ def materialize(
     
     # Track conflicts for reporting
     conflicts = []
+    # Blobs to fetch once every entry has been checked: (entry, relpath, target)
+    downloads: list[tuple[MatEntry, str, Path]] = []
     
     # Use provider to enumerate all entries for the requested layers
     # Sort entries for deterministic order and detect duplicates
@@ -321,24 +328,7 @@ def materialize(
                     })
                     continue
             
-            # Fetch content stream and write with verification
-            try:
-                stream = provider.fetch_oras(entry)
-                write_stream_atomically(target_path, stream, expected_sha=entry.sha256)
-            except ValueError as e:
-                if "SHA mismatch" in str(e):
-                    # Convert SHA mismatch to conflict
-                    # Extract actual SHA from error message
-                    import re
-                    match = re.search(r"got ([a-f0-9]{64})", str(e))
-                    actual_sha = match.group(1) if match else "invalid"
-                    conflicts.append({
-                        "path": entry_path,
-                        "expected_sha256": entry.sha256,
-                        "actual_sha256": actual_sha
-                    })
-                else:
-                    raise
+            downloads.append((entry, entry_path, target_path))
         elif entry.kind == "external":
             # Handle external storage reference
             # Always write pointer file (fulfilled=False initially)
@@ -379,36 +369,21 @@ def materialize(
                         })
                         continue
                 
-                # Fetch external content stream and write
-                try:
-                    stream = provider.fetch_external(entry)
-                    write_stream_atomically(target_path, stream, expected_sha=entry.sha256)
-                    # Success: mark pointer as fulfilled
-                    write_pointer_file(
-                        dest_dir=dest_path,
-                        original_relpath=entry.path,
-                        uri=entry.uri,
-                        sha256=entry.sha256,
-                        size=entry.size,
-                        layer=entry.layer,
-                        tier=entry.tier,
-                        fulfilled=True,
-                        local_path=entry_path
-                    )
-                except ValueError as e:
-                    if "SHA mismatch" in str(e):
-                        # Convert SHA mismatch to conflict
-                        import re
-                        match = re.search(r"got ([a-f0-9]{64})", str(e))
-                        actual_sha = match.group(1) if match else "invalid"
-                        conflicts.append({
-                            "path": entry_path,
-                            "expected_sha256": entry.sha256,
-                            "actual_sha256": actual_sha
-                        })
-                    else:
-                        raise
-    
+                downloads.append((entry, entry_path, target_path))
+
+    # Fetch blobs, overlapping network round trips when concurrency > 1
+    def download(job: tuple[MatEntry, str, Path]) -> dict | None:
+        return _download_entry(provider, dest_path, *job)
+
+    if concurrency > 1 and len(downloads) > 1:
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(downloads))) as pool:
+            results = list(pool.map(download, downloads))
+    else:
+        results = [download(job) for job in downloads]
+    conflicts.extend(c for c in results if c is not None)
+    # Report conflicts in path order regardless of when they were detected
+    conflicts.sort(key=lambda c: c["path"])
+
     # Check for conflicts
     if conflicts and not overwrite:
         raise WorkdirConflict(
@@ -426,6 +401,65 @@ def materialize(
     )
 
 
+def _download_entry(
+    provider: ContentProvider,
+    dest_path: Path,
+    entry: MatEntry,
+    entry_path: str,
+    target_path: Path,
+) -> dict | None:
+    """
+    Fetch one ORAS or external blob and write it to target_path.
+
+    Safe to call from worker threads: each call writes only its own target
+    and, for external entries, its own pointer file.
+
+    Args:
+        provider: ContentProvider used to open the blob stream
+        dest_path: Materialization root (for pointer files)
+        entry: Entry to fetch
+        entry_path: Validated relative path of the entry
+        target_path: Destination file path
+
+    Returns:
+        Conflict record if the fetched content fails SHA verification, else None
+    """
+    try:
+        if entry.kind == "oras":
+            stream = provider.fetch_oras(entry)
+        else:
+            stream = provider.fetch_external(entry)
+        write_stream_atomically(target_path, stream, expected_sha=entry.sha256)
+    except ValueError as e:
+        if "SHA mismatch" in str(e):
+            # Convert SHA mismatch to conflict
+            # Extract actual SHA from error message
+            import re
+            match = re.search(r"got ([a-f0-9]{64})", str(e))
+            actual_sha = match.group(1) if match else "invalid"
+            return {
+                "path": entry_path,
+                "expected_sha256": entry.sha256,
+                "actual_sha256": actual_sha
+            }
+        raise
+
+    if entry.kind == "external":
+        # Success: mark pointer as fulfilled
+        write_pointer_file(
+            dest_dir=dest_path,
+            original_relpath=entry.path,
+            uri=entry.uri,
+            sha256=entry.sha256,
+            size=entry.size,
+            layer=entry.layer,
+            tier=entry.tier,
+            fulfilled=True,
+            local_path=entry_path
+        )
+    return None
+
+
 def _select_role(resolved: ResolvedBundle, ref: BundleRef, role_arg: str | None) -> str:
     """
     Select role using precedence rules from the specification.
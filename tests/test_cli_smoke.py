@@ -180,10 +180,14 @@ class TestCLISmokeTests:
             # The error is handled by run_and_exit which just sets exit code
             # No need to check output message for proper error handling
             
-    def test_push_command_with_version_bump(self):
+    def test_push_command_with_version_bump(self, tmp_path):
         """Test push command with version bump."""
-        bundle_dir = Path(__file__).parent / "fixtures" / "simple-bundle"
-        
+        # Copy bundle to temp directory: the bump rewrites the spec file
+        # even on a dry run, and must not modify the fixture
+        import shutil
+        bundle_dir = tmp_path / "bundle"
+        shutil.copytree(Path(__file__).parent / "fixtures" / "simple-bundle", bundle_dir)
+
         result = self.runner.invoke(app, [
             "push", str(bundle_dir),
             "--bump", "minor",
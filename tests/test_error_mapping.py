@@ -57,6 +57,20 @@ class TestExitCodeMapping:
         assert exit_code_for(FileNotFoundError("test")) == 2  # FileNotFoundError maps to validation error
         assert exit_code_for(PermissionError("test")) == 3
 
+    def test_subclasses_map_like_their_base(self):
+        """Test that subclasses of mapped exceptions inherit their exit code."""
+        import json
+        
+        class WorkdirConflict(Exception):
+            pass
+        
+        class StaleWorkdir(WorkdirConflict):
+            pass
+        
+        assert exit_code_for(StaleWorkdir("stale")) == 12
+        assert exit_code_for(json.JSONDecodeError("bad", "", 0)) == 2  # ValueError subclass
+        assert exit_code_for(IsADirectoryError("test")) == 3  # OSError, not FileNotFoundError
+
     def test_exit_code_constants(self):
         """Test that EXIT_CODES constants match specification."""
         assert EXIT_CODES["BundleNotFoundError"] == 1
@@ -6,6 +6,7 @@ from identical input trees and handles edge cases properly.
 """
 from __future__ import annotations
 
+import io
 import os
 import tarfile
 import tempfile
@@ -15,7 +16,7 @@ from pathlib import Path
 import pytest
 
 from modelops_bundles.export import (
-    write_deterministic_archive, normalize_relpath, _apply_canonical_headers
+    write_deterministic_archive, normalize_relpath, _apply_canonical_headers, _tar_header
 )
 
 
@@ -184,6 +185,48 @@ class TestDeterministicExport:
             # Should be sorted alphabetically
             assert names == sorted(names)
 
+    def test_uncompressed_members_round_trip(self, tmp_path):
+        """Test that file bodies and padding survive the uncompressed tar path."""
+        src = tmp_path / "src"
+        src.mkdir()
+        sizes = [0, 1, 511, 512, 513, 70000]
+        for size in sizes:
+            (src / f"f{size}.bin").write_bytes(os.urandom(size))
+        os.link(src / "f513.bin", src / "hardlink.bin")
+
+        archive = tmp_path / "archive.tar"
+        write_deterministic_archive(str(src), str(archive))
+
+        with tarfile.open(archive, 'r') as tar:
+            for size in sizes:
+                member = tar.getmember(f"f{size}.bin")
+                assert member.size == size
+                assert tar.extractfile(member).read() == (src / f"f{size}.bin").read_bytes()
+            # Second name for the same inode is stored as a hardlink, as tarfile does
+            link = tar.getmember("hardlink.bin")
+            assert link.islnk()
+            assert link.linkname == "f513.bin"
+
+        # Whole archive is block-aligned
+        assert archive.stat().st_size % tarfile.RECORDSIZE == 0
+
+    def test_copy_without_sendfile_matches(self, tmp_path, monkeypatch):
+        """Test the read/write body copy (non-Linux) writes the same archive."""
+        import modelops_bundles.export as export_mod
+
+        src = tmp_path / "src"
+        src.mkdir()
+        for size in [0, 1, 513, 70000]:
+            (src / f"f{size}.bin").write_bytes(os.urandom(size))
+
+        archive1 = tmp_path / "archive1.tar"
+        archive2 = tmp_path / "archive2.tar"
+        write_deterministic_archive(str(src), str(archive1))
+        monkeypatch.setattr(export_mod, "_USE_FILE_SENDFILE", False)
+        write_deterministic_archive(str(src), str(archive2))
+
+        assert archive1.read_bytes() == archive2.read_bytes()
+
 
 class TestHelperFunctions:
     """Test export helper functions."""
@@ -224,3 +267,20 @@ class TestHelperFunctions:
         assert info.mtime == 0
         assert info.mode == 0o644  # Normalized for regular file
 
+    def test_tar_header_matches_tarfile(self):
+        """Test the packed header is byte-identical to tarfile's USTAR header."""
+        tar = tarfile.open(fileobj=io.BytesIO(), mode='w', format=tarfile.USTAR_FORMAT)
+        cases = [
+            ("file.txt", tarfile.REGTYPE, 0o100644, 513, ""),
+            ("bin/tool", tarfile.REGTYPE, 0o100755, 0, ""),
+            ("subdir", tarfile.DIRTYPE, 0o40700, 0, ""),
+            ("link", tarfile.SYMTYPE, 0o120777, 0, "target"),
+            ("caf\u00e9.txt", tarfile.REGTYPE, 0o100644, 7, ""),
+            ("a" * 60 + "/" + "b" * 60, tarfile.REGTYPE, 0o100644, 1, ""),  # needs prefix field
+        ]
+        for name, type_, mode, size, linkname in cases:
+            info = tarfile.TarInfo(name)
+            info.type, info.mode, info.size, info.linkname = type_, mode, size, linkname
+            info.mtime = 1234567890
+            _apply_canonical_headers(info)
+            assert _tar_header(tar, info) == info.tobuf(tar.format, tar.encoding, tar.errors)
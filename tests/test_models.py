@@ -0,0 +1,63 @@
+"""
+Tests for bundle data models.
+
+Covers the cached computed fields on the frozen manifest and plan models.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+from modelops_bundles.models import (
+    BundleManifest, FileEntry, LayerIndex, LayerIndexEntry, LayerPlan, StorageDecision
+)
+
+
+def _entry(path: str) -> LayerIndexEntry:
+    return LayerIndexEntry(
+        path=path, layer="code", oras={"digest": "sha256:" + "a" * 64, "size": 1}
+    )
+
+
+class TestCachedComputedFields:
+    """Test that cached computed fields follow the fields they derive from."""
+
+    def test_layer_index_copy_with_update_recomputes_digest(self):
+        """Test that model_copy(update=...) does not keep the source's digest."""
+        index = LayerIndex(layer="code", entries=[_entry("a.py")])
+        original = index.digest
+
+        copied = index.model_copy(update={"entries": [_entry("b.py")]})
+
+        assert copied.digest == LayerIndex(layer="code", entries=[_entry("b.py")]).digest
+        assert copied.digest != original
+        assert index.digest == original
+
+    def test_bundle_manifest_copy_with_update_recomputes_digest(self):
+        """Test that a copied manifest with a new version gets a new digest."""
+        manifest = BundleManifest(name="b", version="1.0.0", roles={}, layers={})
+        original = manifest.digest
+
+        copied = manifest.model_copy(update={"version": "1.1.0"})
+
+        assert copied.digest == BundleManifest(name="b", version="1.1.0", roles={}, layers={}).digest
+        assert copied.digest != original
+
+    def test_plain_copy_keeps_cached_digest(self):
+        """Test that a copy without updates still carries the same digest."""
+        index = LayerIndex(layer="code", entries=[_entry("a.py")])
+
+        assert index.model_copy().digest == index.digest
+        assert index.model_copy(deep=True).digest == index.digest
+
+    def test_layer_plan_copy_with_update_recomputes_partitions(self):
+        """Test that copied plans partition their own storage decisions."""
+        files = [
+            FileEntry(src_path=Path("a.bin"), artifact_path="a.bin", size=1, sha256="0" * 64, layer="data")
+        ]
+        plan = LayerPlan(name="data", files=files, storage_decisions={"a.bin": StorageDecision.ORAS})
+        assert plan.oras_files == files
+
+        copied = plan.model_copy(update={"storage_decisions": {"a.bin": StorageDecision.EXTERNAL}})
+
+        assert copied.oras_files == []
+        assert copied.external_files == files
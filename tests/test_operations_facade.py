@@ -56,6 +56,28 @@ class TestOperationsFacade:
             assert 'cache' in kwargs and kwargs['cache'] is True
             assert result is mock_resolve.return_value
 
+    def test_resolve_reuses_digest_pinned_results(self):
+        """Test digest refs are resolved once per facade while tag refs are not."""
+        config = OpsConfig(cache=True)
+        registry = FakeOrasBundleRegistry()
+        ops = Operations(config=config, registry=registry)
+        
+        pinned = BundleRef(name="test/bundle", digest="sha256:" + "a" * 64)
+        tagged = BundleRef(name="test/bundle", version="v1.0.0")
+        
+        with patch('modelops_bundles.operations.facade._resolve') as mock_resolve:
+            first = ops.resolve(pinned)
+            assert ops.resolve(pinned) is first
+            assert mock_resolve.call_count == 1
+            
+            ops.resolve(tagged)
+            ops.resolve(tagged)
+            assert mock_resolve.call_count == 3
+            
+            ops.clear_cache()
+            ops.resolve(pinned)
+            assert mock_resolve.call_count == 4
+
     def test_resolve_respects_cache_config(self):
         """Test resolve method respects cache configuration."""
         config = OpsConfig(cache=False)
@@ -115,7 +137,8 @@ class TestOperationsFacade:
                 prefetch_external=True,
                 provider=provider,
                 registry=registry,
-                settings=ops.settings
+                settings=ops.settings,
+                concurrency=config.concurrency
                             )
             assert result is mock_result
             assert result.bundle is mock_resolved
@@ -170,7 +193,7 @@ class TestOperationsFacade:
 
     def test_export_uses_default_zstd_level(self):
         """Test export uses default zstd level from config."""
-        config = OpsConfig()  # Default zstd_level=19
+        config = OpsConfig()  # Default zstd_level=15
         registry = FakeOrasBundleRegistry()
         ops = Operations(config=config, registry=registry)
         
@@ -181,7 +204,7 @@ class TestOperationsFacade:
                 src_dir="/src/dir",
                 out_path="/output.tar",
                 include_external=False,
-                zstd_level=19
+                zstd_level=15
             )
 
     def test_stubbed_commands_return_descriptive_messages(self):
@@ -244,8 +267,9 @@ class TestOpsConfig:
         
         assert config.ci is False
         assert config.cache is True
-        assert config.zstd_level == 19
+        assert config.zstd_level == 15
         assert config.human is True
+        assert config.concurrency == 1
 
     def test_custom_values(self):
         """Test OpsConfig accepts custom values."""
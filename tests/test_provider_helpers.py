@@ -68,4 +68,28 @@ class TestCreateProviderFromEnv:
         with patch.dict(os.environ, env, clear=True):
             with patch('modelops_bundles.storage.oras_bundle_registry.OrasBundleRegistry'):
                 with pytest.raises(ValueError, match="Azure authentication not configured"):
-                    create_provider_from_env()
\ No newline at end of file
+                    create_provider_from_env()
+    
+    def test_shares_injected_settings_and_registry(self):
+        """Test that factory reuses caller-provided settings and registry."""
+        from modelops_bundles.settings import Settings
+        
+        settings = Settings(
+            registry_url="localhost:5000",
+            registry_repo="test/modelops-bundles",
+            az_connection_string="DefaultEndpointsProtocol=https;AccountName=test;AccountKey=key"
+        )
+        registry = object()
+        
+        # Environment is empty: nothing should be loaded from it
+        with patch.dict(os.environ, {}, clear=True):
+            with patch('modelops_bundles.storage.oras_bundle_registry.OrasBundleRegistry') as mock_registry:
+                with patch('modelops_bundles.storage.object_store.AzureExternalAdapter') as mock_azure:
+                    
+                    provider = create_provider_from_env(settings=settings, registry=registry)
+                    
+                    assert isinstance(provider, BundleContentProvider)
+                    assert provider._registry is registry
+                    assert provider._settings is settings
+                    mock_registry.assert_not_called()
+                    mock_azure.assert_called_once_with(settings=settings)
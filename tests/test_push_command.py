@@ -2,10 +2,14 @@
 Tests for push command implementation.
 """
 import pytest
+import yaml
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-from modelops_bundles.operations.facade import Operations, OpsConfig
+from modelops_bundles.operations.facade import (
+    Operations, OpsConfig, _METADATA_KEY_RE, _PLAIN_VERSION_RE, _VERSION_VALUE_RE,
+    _replace_spec_file, _rewrite_spec_version, _update_version_in_spec
+)
 from modelops_bundles.settings import Settings
 from tests.storage.fakes.fake_oras_bundle_registry import FakeOrasBundleRegistry
 
@@ -111,4 +115,148 @@ class TestPushCommand:
         fake_file.write_text("not a directory")
         
         with pytest.raises(ValueError, match="must be a directory"):
-            operations.push(str(fake_file), force=True)
\ No newline at end of file
+            operations.push(str(fake_file), force=True)
+
+
+SPEC = """\
+apiVersion: v1
+kind: Bundle
+metadata:  # bundle identity
+  name: demo
+  version: 1.2.0
+  description: Demo bundle
+spec:
+  layers: []
+"""
+
+
+class TestSpecVersionRewrite:
+    """Test the in-place metadata.version rewrite used by push --bump."""
+    
+    def test_version_patterns(self):
+        """Test the module patterns that gate the line-wise rewrite."""
+        assert _PLAIN_VERSION_RE.fullmatch("1.2.3")
+        assert _PLAIN_VERSION_RE.fullmatch("v10.0.1")
+        assert not _PLAIN_VERSION_RE.fullmatch("1.2")
+        assert not _PLAIN_VERSION_RE.fullmatch("1.2.3-rc1")
+        
+        assert _METADATA_KEY_RE.fullmatch("metadata:")
+        assert _METADATA_KEY_RE.fullmatch("metadata:   # identity")
+        assert not _METADATA_KEY_RE.fullmatch("metadata: {name: demo}")
+        assert not _METADATA_KEY_RE.fullmatch("metadata: &meta")
+        
+        def value(line):
+            return _VERSION_VALUE_RE.fullmatch(line, len("version:"))
+        
+        assert value("version: 1.2.0").group("rest") == ""
+        assert value("version: '1.2.0'  # pinned").group("rest") == "  # pinned"
+        assert value('version: "1.2.0"')
+        assert value("version: &v 1.2.0") is None
+        assert value("version: !!str 1.2.0") is None
+        assert value("version: [1, 2]") is None
+        assert value("version: |") is None
+    
+    def test_plain_rewrite(self):
+        """Test that only the version line changes."""
+        updated = _rewrite_spec_version(SPEC, "1.3.0")
+        
+        assert updated == SPEC.replace("  version: 1.2.0\n", "  version: 1.3.0\n")
+    
+    def test_crlf_line_endings_preserved(self):
+        """Test that CRLF files keep CRLF on every line."""
+        crlf = SPEC.replace("\n", "\r\n")
+        
+        updated = _rewrite_spec_version(crlf, "1.3.0")
+        
+        assert updated == crlf.replace("version: 1.2.0", "version: 1.3.0")
+    
+    def test_trailing_comment_preserved(self):
+        """Test that a comment after the value is kept as written."""
+        text = SPEC.replace("version: 1.2.0", "version: 1.2.0   # bumped by CI")
+        
+        updated = _rewrite_spec_version(text, "2.0.0")
+        
+        assert "  version: 2.0.0   # bumped by CI\n" in updated
+    
+    def test_nested_version_untouched(self):
+        """Test that version keys below metadata's direct children are skipped."""
+        text = SPEC.replace(
+            "  name: demo\n",
+            "  name: demo\n  source:\n    version: 9.9.9\n",
+        ) + "version: 0.0.1\n"
+        
+        updated = _rewrite_spec_version(text, "1.3.0")
+        
+        assert "    version: 9.9.9\n" in updated
+        assert updated.endswith("version: 0.0.1\n")
+        assert yaml.safe_load(updated)["metadata"]["version"] == "1.3.0"
+    
+    def test_quoted_value_replaced(self):
+        """Test that quoted versions are rewritten as plain scalars."""
+        for quoted in ('"1.2.0"', "'1.2.0'"):
+            updated = _rewrite_spec_version(SPEC.replace("1.2.0", quoted), "1.3.0")
+            
+            assert updated == SPEC.replace("1.2.0", "1.3.0")
+    
+    def test_unsafe_layouts_fall_back(self):
+        """Test that layouts the line rewrite cannot handle return None."""
+        flow = "apiVersion: v1\nmetadata: {name: demo, version: 1.2.0}\n"
+        anchor = SPEC.replace("version: 1.2.0", "version: &v 1.2.0")
+        missing = "apiVersion: v1\nspec:\n  layers: []\n"
+        no_version = SPEC.replace("  version: 1.2.0\n", "")
+        
+        for text in (flow, anchor, missing, no_version):
+            assert _rewrite_spec_version(text, "1.3.0") is None
+        # Versions YAML would not read back as the same string
+        assert _rewrite_spec_version(SPEC, "1.3.0-rc1") is None
+    
+    def test_update_keeps_crlf_on_disk(self, tmp_path):
+        """Test that the rewrite reaches disk without newline translation."""
+        spec_path = tmp_path / "modelops.yaml"
+        spec_path.write_bytes(SPEC.replace("\n", "\r\n").encode())
+        
+        _update_version_in_spec(tmp_path, "1.3.0")
+        
+        assert spec_path.read_bytes() == SPEC.replace("\n", "\r\n").replace("1.2.0", "1.3.0").encode()
+    
+    @pytest.mark.parametrize("text", [
+        "apiVersion: v1\nmetadata: {name: demo, version: 1.2.0}\n",
+        SPEC.replace("version: 1.2.0", "version: &v 1.2.0"),
+    ])
+    def test_update_falls_back_to_yaml_round_trip(self, tmp_path, text):
+        """Test flow-mapping and anchored specs go through the C-accelerated dump."""
+        spec_path = tmp_path / "modelops.yaml"
+        spec_path.write_text(text)
+        
+        with patch("yaml.dump", wraps=yaml.dump) as mock_dump:
+            _update_version_in_spec(tmp_path, "1.3.0")
+        
+        expected_dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        assert mock_dump.call_args.kwargs["Dumper"] is expected_dumper
+        assert yaml.safe_load(spec_path.read_text())["metadata"]["version"] == "1.3.0"
+    
+    def test_update_adds_missing_metadata(self, tmp_path):
+        """Test that a spec without a metadata block gains one."""
+        spec_path = tmp_path / "modelops.yaml"
+        spec_path.write_text("apiVersion: v1\nspec:\n  layers: []\n")
+        
+        _update_version_in_spec(tmp_path, "1.3.0")
+        
+        data = yaml.safe_load(spec_path.read_text())
+        assert data["metadata"] == {"version": "1.3.0"}
+        assert data["spec"] == {"layers": []}
+    
+    def test_replace_spec_file_is_atomic(self, tmp_path):
+        """Test that a failed replace keeps the old spec and removes the temp file."""
+        spec_path = tmp_path / "modelops.yaml"
+        spec_path.write_text(SPEC)
+        
+        _replace_spec_file(spec_path, "apiVersion: v2\n")
+        assert spec_path.read_text() == "apiVersion: v2\n"
+        
+        with patch("os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="disk full"):
+                _replace_spec_file(spec_path, SPEC)
+        
+        assert spec_path.read_text() == "apiVersion: v2\n"
+        assert list(tmp_path.iterdir()) == [spec_path]
@@ -256,6 +256,26 @@ def test_materialize_idempotent(tmp_path, seeded_registry):
     assert result1.selected_role == result2.selected_role == "runtime"
 
 
+def test_materialize_concurrent_matches_sequential(tmp_path, seeded_registry):
+    """Test that fetching blobs concurrently writes the same tree as sequential."""
+    registry = seeded_registry
+
+    ref = BundleRef(name="test-bundle", version="1.0")
+    trees = []
+    for concurrency in (1, 4):
+        dest = tmp_path / f"workdir{concurrency}"
+        materialize(ref, str(dest), role="training", provider=FakeProvider(),
+                    registry=registry, concurrency=concurrency)
+        trees.append({
+            p.relative_to(dest).as_posix(): p.read_bytes()
+            for p in sorted(dest.rglob("*"))
+            if p.is_file()
+        })
+
+    assert trees[0] == trees[1]
+    assert "src/model.py" in trees[0]
+
+
 def test_materialize_conflict_no_overwrite(tmp_path, seeded_registry):
     """Test that materialize raises WorkdirConflict when overwrite=False."""
     registry = seeded_registry